@@ -15,16 +15,111 @@ Run with:
     python3 channel_lev0_util.py
 """
 
+import os
 import sys
-from PyQt5.QtCore import Qt, QSettings, pyqtSignal
+from collections import deque, OrderedDict
+from functools import partial
+from PyQt5.QtCore import Qt, QSettings, QTimer, QRegularExpression
 from PyQt5.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout,
-                             QHBoxLayout, QGridLayout, QLabel, QPushButton,
-                             QSpinBox, QLineEdit, QGroupBox,
-                             QTextEdit, QSlider, QTabWidget)
-from PyQt5.QtGui import QFont
-from examples.poco_gui_common import CANConnectionWidget, DARK_THEME_STYLESHEET, create_title_label, create_status_label, CommandRateLimiter
+                             QHBoxLayout, QGridLayout, QFormLayout, QLabel,
+                             QPushButton, QSpinBox, QLineEdit, QGroupBox, QCheckBox,
+                             QPlainTextEdit, QSlider, QTabWidget,
+                             QSizePolicy)
+from PyQt5.QtGui import QFont, QRegularExpressionValidator
+from examples.poco_gui_common import CANConnectionWidget, DARK_THEME_STYLESHEET, create_title_label, create_status_label
 from poco_can.poco_can_interface import PocoCANInterfaceLevel0
 
+# Channel status label stylesheets. Kept as constants so update_status can
+# tell by identity whether a label's style actually changes, and only then
+# make Qt re-parse it.
+_QSS_MODE_UNKNOWN = "font-weight: bold; color: #cccccc;"
+_QSS_MODE_OFF = "font-weight: bold; color: #666666;"
+_QSS_MODE_ON = "font-weight: bold; color: #00ff00;"
+_QSS_OUT_OFF = _QSS_MODE_OFF
+_QSS_OUT_ON = _QSS_MODE_ON
+_QSS_V_OK = "font-weight: bold; color: #ffaa00;"
+_QSS_V_LOW = "font-weight: bold; color: #ff4444; background-color: #440000;"
+_QSS_I_OK = "font-weight: bold; color: #00aaff;"
+_QSS_I_HIGH = "font-weight: bold; color: #ffaa00; background-color: #443300;"
+
+# Shared bold title font, created on first use (needs a QApplication)
+_TITLE_FONT = None
+
+
+def _title_font():
+    """Return the shared title font (QFont is implicitly shared, so copies are cheap)"""
+    global _TITLE_FONT
+    if _TITLE_FONT is None:
+        _TITLE_FONT = QFont("Arial", 12, QFont.Bold)
+    return _TITLE_FONT
+
+
+# Shared validator for 32-bit hex fields (1-8 hex digits), created on first use
+_HEX32_VALIDATOR = None
+
+
+def _hex32_validator():
+    """Return the shared 32-bit hex validator"""
+    global _HEX32_VALIDATOR
+    if _HEX32_VALIDATOR is None:
+        _HEX32_VALIDATOR = QRegularExpressionValidator(QRegularExpression("[0-9A-Fa-f]{1,8}"))
+    return _HEX32_VALIDATOR
+
+
+# Raw PLI example commands: properly encoded PLI messages with CRC and start bits
+# Values from components/lumitec-dev-pli-web/src/shared/poco.test.js
+_RAW_PLI_EXAMPLES = (
+    ("All OFF (T2RGB)", "E0000808"),
+    ("Red Full (T2HSB)", "FFE0080B"),
+    ("White Full (T2HSB)", "FF000809"),
+    ("Brightness Full (T2B)", "C45FE80A"),
+    ("Brightness Half (T2B)", "C4500802"),
+    ("Brightness OFF (T2B)", "C4400804"),
+)
+_RAW_PLI_EXAMPLE_LABELS = tuple(f"{desc}: 0x{value}" for desc, value in _RAW_PLI_EXAMPLES)
+
+# Pre-formatted slider value label texts: 0-255 and 0-100%
+_I8_STR = tuple(map(str, range(256)))
+_PCT_STR = tuple(f"{pct}%" for pct in range(101))
+
+# Channel output mode names used in the status log
+_MODE_NAMES = {0: "OFF", 1: "BIN", 2: "PWM", 3: "PLI"}
+
+# Color presets: (name, hue, saturation, brightness), (name, red, green, blue)
+# and (name, hue, saturation)
+_T2HSB_PRESETS = (
+    ("Red", 0, 255, 255),
+    ("Green", 85, 255, 255),
+    ("Blue", 170, 255, 255),
+    ("White", 0, 0, 255),
+)
+_T2RGB_PRESETS = (
+    ("Red", 31, 0, 0),
+    ("Green", 0, 31, 0),
+    ("Blue", 0, 0, 31),
+    ("Yellow", 31, 31, 0),
+    ("Cyan", 0, 31, 31),
+    ("Magenta", 31, 0, 31),
+    ("White", 31, 31, 31),
+    ("Orange", 31, 16, 0),
+)
+_T2HS_PRESETS = (
+    ("Red", 0, 255),
+    ("Green", 85, 255),
+    ("Blue", 170, 255),
+    ("White", 0, 0),
+)
+
+# Level presets: (name, value) for the PWM duty (%), T2B brightness,
+# T2BD brightness delta and T2P pattern ID
+_PWM_PRESETS = tuple((f"{pct}%", pct) for pct in (0, 25, 50, 75, 100))
+_T2B_PRESETS = (("Off", 0), ("25%", 64), ("50%", 128), ("75%", 191), ("100%", 255))
+_T2BD_PRESETS = (("-50", -50), ("-25", -25), ("-10", -10), ("+10", 10), ("+25", 25), ("+50", 50))
+_T2P_PRESETS = (
+    ("Color Cycle", 4),
+    ("Cross Fade", 5),
+)
+
 
 class ChannelStatusWidget(QWidget):
     """
@@ -32,10 +127,31 @@ class ChannelStatusWidget(QWidget):
     Shows mode, output level, input voltage, and current.
     """
 
+    # Display name and mode label style, indexed by mode
+    _MODE_TABLE = ("OFF", "BIN", "PWM", "PLI")
+    _MODE_QSS = (_QSS_MODE_OFF, _QSS_MODE_ON, _QSS_MODE_ON, _QSS_MODE_ON)
+
+    # Output level (0-255) -> percentage text, shared by all channels
+    _pct_cache = {}
+
+    # Voltage (0.1 V steps) / current (0.01 A steps) -> text, shared by all
+    # channels and bounded to TEXT_CACHE_SIZE entries each
+    TEXT_CACHE_SIZE = 256
+    _v_cache = OrderedDict()
+    _i_cache = OrderedDict()
+
+    # Fixed width of the value labels, wide enough for "UNK(255)"
+    VALUE_LABEL_WIDTH = 70
+
     def __init__(self, channel_num):
         super().__init__()
         self.channel_num = channel_num
         self.setFixedHeight(120)
+        self._last_state = None
+        self._mode_qss = _QSS_MODE_UNKNOWN
+        self._out_qss = _QSS_OUT_ON
+        self._v_qss = _QSS_V_OK
+        self._i_qss = _QSS_I_OK
         self._setup_ui()
 
     def _setup_ui(self):
@@ -45,7 +161,7 @@ class ChannelStatusWidget(QWidget):
 
         # Channel title
         title = QLabel(f"Channel {self.channel_num}")
-        title.setFont(QFont("Arial", 12, QFont.Bold))
+        title.setFont(_title_font())
         title.setAlignment(Qt.AlignCenter)
         layout.addWidget(title)
 
@@ -56,28 +172,44 @@ class ChannelStatusWidget(QWidget):
         # Mode
         grid.addWidget(QLabel("Mode:"), 0, 0)
         self.mode_label = QLabel("Unknown")
-        self.mode_label.setStyleSheet("font-weight: bold; color: #cccccc;")
+        self.mode_label.setStyleSheet(self._mode_qss)
         grid.addWidget(self.mode_label, 0, 1)
 
         # Output Level
         grid.addWidget(QLabel("Output:"), 1, 0)
         self.output_label = QLabel("0%")
-        self.output_label.setStyleSheet("font-weight: bold; color: #00ff00;")
+        self.output_label.setStyleSheet(self._out_qss)
         grid.addWidget(self.output_label, 1, 1)
 
         # Input Voltage (for fuse detection)
         grid.addWidget(QLabel("Input V:"), 2, 0)
         self.voltage_label = QLabel("0.0V")
-        self.voltage_label.setStyleSheet("font-weight: bold; color: #ffaa00;")
+        self.voltage_label.setStyleSheet(self._v_qss)
         grid.addWidget(self.voltage_label, 2, 1)
 
         # Current
         grid.addWidget(QLabel("Current:"), 3, 0)
         self.current_label = QLabel("0.0A")
-        self.current_label.setStyleSheet("font-weight: bold; color: #00aaff;")
+        self.current_label.setStyleSheet(self._i_qss)
         grid.addWidget(self.current_label, 3, 1)
 
+        # Fixed-size value labels: text changes then never re-run the grid layout
+        for value_label in (self.mode_label, self.output_label, self.voltage_label, self.current_label):
+            value_label.setFixedWidth(self.VALUE_LABEL_WIDTH)
+            value_label.setSizePolicy(QSizePolicy.Fixed, QSizePolicy.Fixed)
+
         layout.addLayout(grid)
+        self.setMinimumSize(self.sizeHint())
+
+    @classmethod
+    def _cached_text(cls, cache, key, text_format, divisor):
+        """Return text_format applied to key / divisor, formatting each key only once"""
+        text = cache.get(key)
+        if text is None:
+            text = cache[key] = text_format.format(key / divisor)
+            if len(cache) > cls.TEXT_CACHE_SIZE:
+                cache.popitem(last=False)
+        return text
 
     def update_status(self, mode, output_level, input_voltage, current):
         """
@@ -89,51 +221,91 @@ class ChannelStatusWidget(QWidget):
             input_voltage: Input voltage in mV
             current: Current in mA
         """
-        # Mode
-        mode_names = {0: "OFF", 1: "BIN", 2: "PWM", 3: "PLI"}
-        mode_str = mode_names.get(mode, f"UNK({mode})")
-        self.mode_label.setText(mode_str)
+        state = (mode, output_level, input_voltage, current)
+        if state == self._last_state:
+            return
+        self._last_state = state
 
-        # Color mode label based on status
-        if mode == 0:
-            self.mode_label.setStyleSheet("font-weight: bold; color: #666666;")
+        # Mode, colored by status
+        if 0 <= mode < 4:
+            self.mode_label.setText(self._MODE_TABLE[mode])
+            qss = self._MODE_QSS[mode]
         else:
-            self.mode_label.setStyleSheet("font-weight: bold; color: #00ff00;")
+            self.mode_label.setText(f"UNK({mode})")
+            qss = _QSS_MODE_ON
+        if qss is not self._mode_qss:
+            self.mode_label.setStyleSheet(qss)
+            self._mode_qss = qss
 
         # Output Level
         if mode == 0:
             self.output_label.setText("0%")
-            self.output_label.setStyleSheet("font-weight: bold; color: #666666;")
+            qss = _QSS_OUT_OFF
         elif mode == 1:  # BIN
             self.output_label.setText("ON" if output_level > 0 else "OFF")
-            self.output_label.setStyleSheet("font-weight: bold; color: #00ff00;" if output_level > 0 else "font-weight: bold; color: #666666;")
+            qss = _QSS_OUT_ON if output_level > 0 else _QSS_OUT_OFF
         else:  # PWM or PLI
-            percent = (output_level / 255.0) * 100
-            self.output_label.setText(f"{percent:.0f}%")
-            self.output_label.setStyleSheet("font-weight: bold; color: #00ff00;")
+            percent_str = self._pct_cache.get(output_level)
+            if percent_str is None:
+                percent_str = self._pct_cache[output_level] = f"{(output_level / 255.0) * 100:.0f}%"
+            self.output_label.setText(percent_str)
+            qss = _QSS_OUT_ON
+        if qss is not self._out_qss:
+            self.output_label.setStyleSheet(qss)
+            self._out_qss = qss
 
         # Input Voltage (highlight if low - indicates blown fuse)
-        voltage_v = input_voltage / 1000.0
-        self.voltage_label.setText(f"{voltage_v:.1f}V")
-        if voltage_v < 8.0:  # Low voltage - possible blown fuse
-            self.voltage_label.setStyleSheet("font-weight: bold; color: #ff4444; background-color: #440000;")
-        else:
-            self.voltage_label.setStyleSheet("font-weight: bold; color: #ffaa00;")
+        self.voltage_label.setText(self._cached_text(self._v_cache, (input_voltage + 50) // 100, "{:.1f}V", 10))
+        qss = _QSS_V_LOW if input_voltage < 8000 else _QSS_V_OK  # Low voltage (< 8 V) - possible blown fuse
+        if qss is not self._v_qss:
+            self.voltage_label.setStyleSheet(qss)
+            self._v_qss = qss
 
         # Current
-        current_a = current / 1000.0
-        self.current_label.setText(f"{current_a:.2f}A")
-        if current_a > 10.0:  # High current warning
-            self.current_label.setStyleSheet("font-weight: bold; color: #ffaa00; background-color: #443300;")
-        else:
-            self.current_label.setStyleSheet("font-weight: bold; color: #00aaff;")
+        self.current_label.setText(self._cached_text(self._i_cache, (current + 5) // 10, "{:.2f}A", 100))
+        qss = _QSS_I_HIGH if current > 10000 else _QSS_I_OK  # High current (> 10 A) warning
+        if qss is not self._i_qss:
+            self.current_label.setStyleSheet(qss)
+            self._i_qss = qss
 
 
 class ChannelOutputCommandsGUI(QMainWindow):
     """GUI for low-level channel output command control and monitoring."""
 
-    # Signal for thread-safe GUI updates
-    channel_status_signal = pyqtSignal(int, int, int, int, int)  # channel, mode, output_level, input_voltage, current
+    # Channel status display refresh interval (~30 Hz)
+    STATUS_FLUSH_INTERVAL_MS = 33
+
+    # Delay after start-up before the remaining command tabs are built in the background
+    DEFERRED_TABS_DELAY_MS = 500
+
+    # Status frames buffered between flushes (oldest dropped beyond this)
+    STATUS_QUEUE_SIZE = 1024
+
+    # Minimum spacing of PWM commands while the slider is dragged
+    PWM_SEND_INTERVAL_MS = 50
+
+    # Quiet period before a debounced slider label update is applied
+    LABEL_DEBOUNCE_MS = 30
+
+    # Status line text changes are applied at most once per this interval
+    STATUS_TEXT_DELAY_MS = 30
+
+    # Interface send methods used by the command tabs, bound on connect
+    SEND_METHODS = {
+        "binary": "send_binary_channel",
+        "pwm": "send_pwm_channel",
+        "raw": "send_pli_raw",
+        "t2hsb": "send_pli_t2hsb",
+        "t2rgb": "send_pli_t2rgb",
+        "t2hs": "send_pli_t2hs",
+        "t2b": "send_pli_t2b",
+        "t2bd": "send_pli_t2bd",
+        "t2p": "send_pli_t2p",
+    }
+
+    # Command log: lines kept and refresh interval (5 Hz)
+    LOG_MAX_LINES = 500
+    LOG_FLUSH_INTERVAL_MS = 200
 
     def __init__(self):
         super().__init__()
@@ -164,15 +336,56 @@ class ChannelOutputCommandsGUI(QMainWindow):
             QSlider:disabled {
                 background-color: #2a2a2a;
             }
+            QPushButton[sendBtn="true"] {
+                min-height: 26px;  /* 40px with the 6px padding and 1px border */
+            }
         """
         self.setStyleSheet(enhanced_stylesheet)
 
-        # Connect signal for thread-safe GUI updates
-        self.channel_status_signal.connect(self._update_channel_status_safe)
-
-        # Rate limiter for PWM commands (delay to prevent flooding)
-        self.pwm_rate_limiter = CommandRateLimiter()
-
+        # Status frames are queued by the CAN thread and flushed to the display
+        # by a GUI timer, so repaint work follows the timer rate rather than
+        # the CAN message rate. The callback only appends a tuple to a deque,
+        # which is atomic, so no lock is needed.
+        self._status_q = deque(maxlen=self.STATUS_QUEUE_SIZE)
+        append_status = self._status_q.append
+        self._status_callback = lambda *status: append_status(status)
+        self._last_shown = {}
+        self._status_timer = QTimer(self)
+        self._status_timer.setInterval(self.STATUS_FLUSH_INTERVAL_MS)
+        self._status_timer.timeout.connect(self._flush_pending_status)
+
+        # Command log lines are buffered and appended to the widget in batches;
+        # lines beyond LOG_MAX_LINES would be dropped by the widget anyway
+        self._log_buffer = deque(maxlen=self.LOG_MAX_LINES)
+        self._logged_mode_level = {}
+        self._log_timer = QTimer(self)
+        self._log_timer.setInterval(self.LOG_FLUSH_INTERVAL_MS)
+        self._log_timer.timeout.connect(self._flush_log)
+        self._log_timer.start()
+
+        # PWM slider changes are coalesced to prevent flooding: the first change
+        # is sent immediately, later ones at most once per PWM_SEND_INTERVAL_MS
+        self._pwm_pending = None
+        self._pwm_timer = QTimer(self)
+        self._pwm_timer.setSingleShot(True)
+        self._pwm_timer.setInterval(self.PWM_SEND_INTERVAL_MS)
+        self._pwm_timer.timeout.connect(self._flush_pwm)
+
+        # Status line text waiting to be shown, see _set_status()
+        self._pending_status_text = None
+        self._status_text_timer = QTimer(self)
+        self._status_text_timer.setSingleShot(True)
+        self._status_text_timer.setInterval(self.STATUS_TEXT_DELAY_MS)
+        self._status_text_timer.timeout.connect(self._flush_status_text)
+
+        # Parsed value of the raw PLI hex field, None while it is not valid
+        self._raw_pli_value = 0
+
+        # Debounced calls, see _debounce(): latest function and timer per key
+        self._debounced = {}
+        self._debounce_timers = {}
+
+        self._bind_send_methods(None)
         self._setup_ui()
 
     def _setup_ui(self):
@@ -206,66 +419,64 @@ class ChannelOutputCommandsGUI(QMainWindow):
 
         layout.addWidget(status_group)
 
-        # Tabs for different command types - Store tab widget and tab content for enable/disable
+        # Tabs for different command types
         self.command_tabs = QTabWidget()
-
-        # Store references to each tab's content widget for targeted enable/disable
-        self.tab_contents = []
-
-        # Tab 1: Binary Channel Control
-        binary_tab = self._create_binary_tab()
-        self.tab_contents.append(binary_tab)
-        self.command_tabs.addTab(binary_tab, "Binary (On/Off)")
-
-        # Tab 2: PWM Channel Control
-        pwm_tab = self._create_pwm_tab()
-        self.tab_contents.append(pwm_tab)
-        self.command_tabs.addTab(pwm_tab, "PWM (Brightness)")
-
-        # Tab 3: Raw PLI Message
-        raw_pli_tab = self._create_raw_pli_tab()
-        self.tab_contents.append(raw_pli_tab)
-        self.command_tabs.addTab(raw_pli_tab, "Raw PLI (Hex)")
-
-        # Tab 4: PLI T2HSB
-        t2hsb_tab = self._create_t2hsb_tab()
-        self.tab_contents.append(t2hsb_tab)
-        self.command_tabs.addTab(t2hsb_tab, "T2HSB (Hue/Sat/Bright)")
-
-        # Tab 5: PLI T2RGB
-        t2rgb_tab = self._create_t2rgb_tab()
-        self.tab_contents.append(t2rgb_tab)
-        self.command_tabs.addTab(t2rgb_tab, "T2RGB (RGB Color)")
-
-        # Tab 6: PLI T2HS
-        t2hs_tab = self._create_t2hs_tab()
-        self.tab_contents.append(t2hs_tab)
-        self.command_tabs.addTab(t2hs_tab, "T2HS (Hue/Sat)")
-
-        # Tab 7: PLI T2B
-        t2b_tab = self._create_t2b_tab()
-        self.tab_contents.append(t2b_tab)
-        self.command_tabs.addTab(t2b_tab, "T2B (Brightness)")
-
-        # Tab 8: PLI T2BD
-        t2bd_tab = self._create_t2bd_tab()
-        self.tab_contents.append(t2bd_tab)
-        self.command_tabs.addTab(t2bd_tab, "T2BD (Brightness Delta)")
-
-        # Tab 9: PLI T2P
-        t2p_tab = self._create_t2p_tab()
-        self.tab_contents.append(t2p_tab)
-        self.command_tabs.addTab(t2p_tab, "T2P (Pattern)")
+        # A native window handle requested inside the tabs stops at the tab
+        # widget instead of making the central widget and its siblings native
+        self.command_tabs.setAttribute(Qt.WA_DontCreateNativeAncestors)
+        # Plain document-mode tab bar: no frame around the pages and no scroll
+        # buttons; tab titles are elided instead when the window is narrow
+        self.command_tabs.setDocumentMode(True)
+        self.command_tabs.setUsesScrollButtons(False)
+        self.command_tabs.setElideMode(Qt.ElideRight)
+        self.command_tabs.tabBar().setExpanding(False)
+
+        # Tab contents are built the first time a tab is shown; until then each
+        # page is an empty placeholder the real content is added to.
+        # _tab_builders maps tab index -> builder for tabs not built yet.
+        # _tab_widgets keeps every page; enabling/disabling a page covers the
+        # controls added to it later while keeping tab navigation active.
+        tabs = (
+            (self._create_binary_tab, "Binary (On/Off)"),
+            (self._create_pwm_tab, "PWM (Brightness)"),
+            (self._create_raw_pli_tab, "Raw PLI (Hex)"),
+            (self._create_t2hsb_tab, "T2HSB (Hue/Sat/Bright)"),
+            (self._create_t2rgb_tab, "T2RGB (RGB Color)"),
+            (self._create_t2hs_tab, "T2HS (Hue/Sat)"),
+            (self._create_t2b_tab, "T2B (Brightness)"),
+            (self._create_t2bd_tab, "T2BD (Brightness Delta)"),
+            (self._create_t2p_tab, "T2P (Pattern)"),
+        )
+        self._tab_builders = {}
+        self._tab_widgets = []
+        for create_tab, tab_name in tabs:
+            placeholder = QWidget()
+            QVBoxLayout(placeholder).setContentsMargins(0, 0, 0, 0)
+            self._tab_widgets.append(placeholder)
+            self._tab_builders[self.command_tabs.addTab(placeholder, tab_name)] = create_tab
+
+        self.command_tabs.currentChanged.connect(self._ensure_tab_built)
+        # Even the initially visible tab is only built once the window is up;
+        # the others follow shortly after, while the user is idle
+        QTimer.singleShot(0, lambda: self._ensure_tab_built(self.command_tabs.currentIndex()))
+        QTimer.singleShot(self.DEFERRED_TABS_DELAY_MS, self._build_deferred_tabs)
 
         layout.addWidget(self.command_tabs)
 
         # Log
+        log_header = QHBoxLayout()
         log_label = QLabel("Command Log:")
-        log_label.setFont(QFont("Arial", 12, QFont.Bold))
-        layout.addWidget(log_label)
-
-        self.log_text = QTextEdit()
+        log_label.setFont(_title_font())
+        log_header.addWidget(log_label)
+        log_header.addStretch()
+        self.verbose_status_check = QCheckBox("Log every status update")
+        self.verbose_status_check.setToolTip("When off, only mode and output level changes are logged")
+        log_header.addWidget(self.verbose_status_check)
+        layout.addLayout(log_header)
+
+        self.log_text = QPlainTextEdit()
         self.log_text.setReadOnly(True)
+        self.log_text.setMaximumBlockCount(self.LOG_MAX_LINES)
         self.log_text.setMaximumHeight(150)
         layout.addWidget(self.log_text)
 
@@ -276,20 +487,61 @@ class ChannelOutputCommandsGUI(QMainWindow):
         # Disable all controls initially (until CAN connection established)
         self._set_controls_enabled(False)
 
+    def _ensure_tab_built(self, index):
+        """Create the content of a command tab on its first visit"""
+        create_tab = self._tab_builders.pop(index, None)
+        if create_tab is not None:
+            # The content is built unparented and inserted in one step; updates
+            # stay off meanwhile so the page is laid out and painted only once
+            page = self.command_tabs.widget(index)
+            page.setUpdatesEnabled(False)
+            try:
+                page.layout().addWidget(create_tab())
+            finally:
+                page.setUpdatesEnabled(True)
+
+    def _build_deferred_tabs(self):
+        """Build the not yet visited tabs, one per event loop pass to stay responsive"""
+        if self._tab_builders:
+            self._ensure_tab_built(min(self._tab_builders))
+        if self._tab_builders:
+            QTimer.singleShot(0, self._build_deferred_tabs)
+
+    def _debounce(self, key, fn, ms=50):
+        """Call fn once no further call for the same key arrived within ms"""
+        self._debounced[key] = fn
+        timer = self._debounce_timers.get(key)
+        if timer is None:
+            timer = self._debounce_timers[key] = QTimer(self)
+            timer.setSingleShot(True)
+            timer.timeout.connect(partial(self._run_debounced, key))
+        timer.start(ms)
+
+    def _run_debounced(self, key):
+        """Run the pending debounced call for key"""
+        fn = self._debounced.pop(key, None)
+        if fn is not None:
+            fn()
+
     def _set_controls_enabled(self, enabled):
         """Enable or disable all command control widgets while keeping tab navigation active"""
-        # Disable each tab's content widget individually, preserving tab navigation
-        for tab_widget in self.tab_contents:
-            tab_widget.setEnabled(enabled)
+        for page in self._tab_widgets:
+            page.setEnabled(enabled)
+
+    def _create_spin(self, minimum, maximum, value=None):
+        """Create a QSpinBox with the given range and initial value (default: minimum)"""
+        spin = QSpinBox()
+        spin.setRange(minimum, maximum)
+        if value is not None:
+            spin.setValue(value)
+        return spin
 
     def _create_channel_selection_layout(self, prefix):
         """Create common channel selection layout and return (layout, spinbox)"""
         channel_layout = QHBoxLayout()
         channel_layout.addWidget(QLabel("Output Channel (0-4, 0: All):"))
 
-        channel_spin = QSpinBox()
-        channel_spin.setMinimum(0)
-        channel_spin.setMaximum(4)
+        channel_spin = self._create_spin(0, 4)
         setattr(self, f"{prefix}_channel_spin", channel_spin)
 
         channel_layout.addWidget(channel_spin)
@@ -300,30 +552,37 @@ class ChannelOutputCommandsGUI(QMainWindow):
     def _create_pli_protocol_group(self, prefix):
         """Create common PLI Protocol group and return (group, clan_spin, transition_spin)"""
         protocol_group = QGroupBox("PLI Protocol")
-        protocol_layout = QGridLayout(protocol_group)
+        protocol_layout = QFormLayout()
 
         # PLI Clan
-        protocol_layout.addWidget(QLabel("PLI Clan (0-63):"), 0, 0)
-        clan_spin = QSpinBox()
-        clan_spin.setMinimum(0)
-        clan_spin.setMaximum(63)
-        clan_spin.setValue(0)
-        protocol_layout.addWidget(clan_spin, 0, 1)
-        protocol_layout.addWidget(QLabel("(6-bit PLI clan identifier)"), 0, 2)
+        clan_spin = self._create_spin(0, 63)
+        clan_spin.setToolTip("6-bit PLI clan identifier")
+        protocol_layout.addRow("PLI Clan (0-63):", clan_spin)
         setattr(self, f"{prefix}_clan_spin", clan_spin)
 
         # Transition
-        protocol_layout.addWidget(QLabel("Transition (0-7):"), 1, 0)
-        transition_spin = QSpinBox()
-        transition_spin.setMinimum(0)
-        transition_spin.setMaximum(7)
-        transition_spin.setValue(0)
-        protocol_layout.addWidget(transition_spin, 1, 1)
-        protocol_layout.addWidget(QLabel("(3-bit transition mode)"), 1, 2)
+        transition_spin = self._create_spin(0, 7)
+        transition_spin.setToolTip("3-bit transition mode")
+        protocol_layout.addRow("Transition (0-7):", transition_spin)
         setattr(self, f"{prefix}_transition_spin", transition_spin)
 
+        protocol_group.setLayout(protocol_layout)
         return protocol_group, clan_spin, transition_spin
 
+    def _build_preset_row(self, specs, on_click):
+        """
+        Create a row of preset buttons and return (layout, buttons).
+        Each spec is (button text, *args); clicking calls on_click(*args).
+        """
+        row = QHBoxLayout()
+        buttons = []
+        for name, *args in specs:
+            btn = QPushButton(name)
+            btn.clicked.connect(partial(on_click, *args))
+            row.addWidget(btn)
+            buttons.append(btn)
+        return row, buttons
+
     def _create_tab_base(self, description):
         """Create base tab structure with description and return (tab, layout)"""
         tab = QWidget()
@@ -358,17 +617,21 @@ class ChannelOutputCommandsGUI(QMainWindow):
         self.poco.discovered_devices = base_interface.discovered_devices
         self.poco.enumeration_callbacks = base_interface.enumeration_callbacks
 
+        # Resolve the send methods once instead of on every command
+        self._bind_send_methods(self.poco)
+
         # Update the connection widget to use our Level 0 interface for discovery
         self.can_widget.set_poco_interface(self.poco)
 
         # Set up status monitoring callback
-        self.poco.add_channel_status_callback(self._on_channel_status_update)
+        self.poco.add_channel_status_callback(self._status_callback)
         self.poco.start_listener()
+        self._status_timer.start()
 
         # Enable all controls now that we're connected
         self._set_controls_enabled(True)
 
-        self.status_label.setText(f"Connected - Level 0 Protocol Active")
+        self._set_status(f"Connected - Level 0 Protocol Active")
         self._log("Connected to CAN bus - Level 0 Protocol Active")
 
     def _on_disconnected(self):
@@ -386,35 +649,79 @@ class ChannelOutputCommandsGUI(QMainWindow):
                 self.poco.notifier.stop()
                 self.poco.notifier = None
             # Remove callbacks
-            self.poco.remove_channel_status_callback(self._on_channel_status_update)
+            self.poco.remove_channel_status_callback(self._status_callback)
             self.poco = None
+            self._bind_send_methods(None)
+
+        # No status can arrive while disconnected; show what was received, then stop polling
+        self._flush_pending_status()
+        self._status_timer.stop()
 
         # Disable all controls when disconnected
         self._set_controls_enabled(False)
 
-        self.status_label.setText("Not connected")
+        self._set_status("Not connected")
         self._log("Disconnected from CAN bus")
 
+    def _bind_send_methods(self, poco):
+        """Rebuild the _send dispatch table from poco's bound send methods (empty when disconnected)"""
+        self._dispatch = {kind: getattr(poco, name) for kind, name in self.SEND_METHODS.items()} if poco else {}
+
+    def _send(self, kind, args, log_text, status_text):
+        """
+        Send one command through the dispatch table and report the outcome.
+        Returns True if the command was sent.
+        """
+        send = self._dispatch.get(kind)
+        if send is None:
+            self._set_status("Not connected")
+            return False
+
+        try:
+            send(*args)
+        except Exception as e:
+            self._log(f"ERROR: {str(e)}")
+            self._set_status(f"Error: {str(e)}")
+            return False
+
+        self._log(log_text)
+        self._set_status(status_text)
+        return True
+
     def _on_connection_failed(self, error_msg):
         """Called when CAN connection fails"""
-        self.status_label.setText(f"Connection failed: {error_msg}")
+        self._set_status(f"Connection failed: {error_msg}")
         self._log(f"ERROR: {error_msg}")
 
-    def _on_channel_status_update(self, channel, mode, output_level, input_voltage_mv, current_ma):
-        """Called when channel status is received from CAN bus (thread-safe)"""
-        # Emit signal to handle GUI updates on main thread
-        self.channel_status_signal.emit(channel, mode, output_level, input_voltage_mv, current_ma)
+    def _flush_pending_status(self):
+        """Apply the latest status of each channel that changed since the last flush"""
+        status_q = self._status_q
+        if not status_q:
+            return
+
+        # Drain the queue; the last frame per channel wins
+        pending = {}
+        while status_q:
+            frame = status_q.popleft()
+            pending[frame[0]] = frame[1:]
+
+        for channel, status in pending.items():
+            if self._last_shown.get(channel) != status:
+                self._last_shown[channel] = status
+                self._apply_channel_status(channel, *status)
 
-    def _update_channel_status_safe(self, channel, mode, output_level, input_voltage_mv, current_ma):
-        """Thread-safe method to update channel status display"""
+    def _apply_channel_status(self, channel, mode, output_level, input_voltage_mv, current_ma):
+        """Update channel status display (GUI thread, called from _flush_pending_status)"""
         if 1 <= channel <= 4:
             widget_index = channel - 1
             if widget_index < len(self.channel_status_widgets):
                 self.channel_status_widgets[widget_index].update_status(mode, output_level, input_voltage_mv, current_ma)
 
-            # Log status updates
-            mode_names = {0: "OFF", 1: "BIN", 2: "PWM", 3: "PLI"}
-            mode_str = mode_names.get(mode, f"UNK({mode})")
+            # Log status updates (voltage/current-only changes only in verbose mode)
+            if self._logged_mode_level.get(channel) == (mode, output_level) and not self.verbose_status_check.isChecked():
+                return
+            self._logged_mode_level[channel] = (mode, output_level)
+            mode_str = _MODE_NAMES.get(mode, f"UNK({mode})")
             self._log(f"Status Ch{channel}: {mode_str}, Level={output_level}, {input_voltage_mv/1000:.1f}V, {current_ma/1000:.2f}A")
 
     def _create_binary_tab(self):
@@ -429,12 +736,12 @@ class ChannelOutputCommandsGUI(QMainWindow):
         btn_layout = QHBoxLayout()
 
         self.bin_on_btn = QPushButton("Turn ON")
-        self.bin_on_btn.setMinimumHeight(40)
+        self.bin_on_btn.setProperty("sendBtn", True)
         self.bin_on_btn.clicked.connect(lambda: self._send_binary_command(1))
         btn_layout.addWidget(self.bin_on_btn)
 
         self.bin_off_btn = QPushButton("Turn OFF")
-        self.bin_off_btn.setMinimumHeight(40)
+        self.bin_off_btn.setProperty("sendBtn", True)
         self.bin_off_btn.clicked.connect(lambda: self._send_binary_command(0))
         btn_layout.addWidget(self.bin_off_btn)
 
@@ -471,14 +778,9 @@ class ChannelOutputCommandsGUI(QMainWindow):
         pwm_layout.addLayout(slider_layout)
         layout.addLayout(pwm_layout)
 
-        # Quick preset buttons
-        preset_layout = QHBoxLayout()
-        self.pwm_preset_btns = []
-        for pct in [0, 25, 50, 75, 100]:
-            btn = QPushButton(f"{pct}%")
-            btn.clicked.connect(lambda checked, p=pct: self._set_pwm_preset(p))
-            preset_layout.addWidget(btn)
-            self.pwm_preset_btns.append(btn)
+        # Quick preset buttons; setting the slider sends the command via its
+        # valueChanged signal
+        preset_layout, self.pwm_preset_btns = self._build_preset_row(_PWM_PRESETS, self.pwm_slider.setValue)
         layout.addLayout(preset_layout)
 
         # Info about automatic sending
@@ -509,7 +811,9 @@ class ChannelOutputCommandsGUI(QMainWindow):
         self.raw_pli_edit.setPlaceholderText("00000000")
         self.raw_pli_edit.setMaxLength(8)
         self.raw_pli_edit.setText("00000000")
-        # Only allow hex characters
+        # Only allow hex characters; the value is parsed as it is typed
+        self.raw_pli_edit.setValidator(_hex32_validator())
+        self.raw_pli_edit.textChanged.connect(self._on_raw_pli_text_changed)
         hex_layout.addWidget(self.raw_pli_edit)
 
         msg_layout.addLayout(hex_layout)
@@ -517,32 +821,22 @@ class ChannelOutputCommandsGUI(QMainWindow):
 
         # Send button
         self.raw_pli_send_btn = QPushButton("Send Raw PLI Message")
-        self.raw_pli_send_btn.setMinimumHeight(40)
+        self.raw_pli_send_btn.setProperty("sendBtn", True)
         self.raw_pli_send_btn.clicked.connect(self._send_raw_pli_command)
         layout.addWidget(self.raw_pli_send_btn)
 
         # Example commands
         examples_group = QGroupBox("Example Commands (clickable)")
-        examples_layout = QVBoxLayout(examples_group)
-
-        # These are properly encoded PLI messages with CRC and start bits
-        # Values from components/lumitec-dev-pli-web/src/shared/poco.test.js
-        examples = [
-            ("All OFF (T2RGB)", "E0000808"),
-            ("Red Full (T2HSB)", "FFE0080B"),
-            ("White Full (T2HSB)", "FF000809"),
-            ("Brightness Full (T2B)", "C45FE80A"),
-            ("Brightness Half (T2B)", "C4500802"),
-            ("Brightness OFF (T2B)", "C4400804"),
-        ]
+        examples_layout = QVBoxLayout()
 
         self.raw_pli_example_btns = []
-        for desc, value in examples:
-            btn = QPushButton(f"{desc}: 0x{value}")
-            btn.clicked.connect(lambda checked, v=value: self.raw_pli_edit.setText(v))
+        for label, (_, value) in zip(_RAW_PLI_EXAMPLE_LABELS, _RAW_PLI_EXAMPLES):
+            btn = QPushButton(label)
+            btn.clicked.connect(partial(self.raw_pli_edit.setText, value))
             examples_layout.addWidget(btn)
             self.raw_pli_example_btns.append(btn)
 
+        examples_group.setLayout(examples_layout)
         layout.addWidget(examples_group)
         layout.addStretch()
 
@@ -562,61 +856,42 @@ class ChannelOutputCommandsGUI(QMainWindow):
 
         # HSB controls
         hsb_group = QGroupBox("Color (HSB)")
-        hsb_layout = QGridLayout(hsb_group)
+        hsb_layout = QFormLayout()
 
         # Hue
-        hsb_layout.addWidget(QLabel("Hue (0-255):"), 0, 0)
-        self.t2hsb_hue_spin = QSpinBox()
-        self.t2hsb_hue_spin.setMinimum(0)
-        self.t2hsb_hue_spin.setMaximum(255)
-        self.t2hsb_hue_spin.setValue(0)
-        hsb_layout.addWidget(self.t2hsb_hue_spin, 0, 1)
-        hsb_layout.addWidget(QLabel("(0=Red, 85=Green, 170=Blue)"), 0, 2)
+        self.t2hsb_hue_spin = self._create_spin(0, 255)
+        self.t2hsb_hue_spin.setToolTip("0=Red, 85=Green, 170=Blue")
+        hsb_layout.addRow("Hue (0-255):", self.t2hsb_hue_spin)
 
         # Saturation
-        hsb_layout.addWidget(QLabel("Saturation (0-15):"), 1, 0)
-        self.t2hsb_sat_spin = QSpinBox()
-        self.t2hsb_sat_spin.setMinimum(0)
-        self.t2hsb_sat_spin.setMaximum(15)
-        self.t2hsb_sat_spin.setValue(15)
-        hsb_layout.addWidget(self.t2hsb_sat_spin, 1, 1)
-        hsb_layout.addWidget(QLabel("(0=White, 7=Full color)"), 1, 2)
+        self.t2hsb_sat_spin = self._create_spin(0, 15, 15)
+        self.t2hsb_sat_spin.setToolTip("0=White, 7=Full color")
+        hsb_layout.addRow("Saturation (0-15):", self.t2hsb_sat_spin)
 
         # Brightness
-        hsb_layout.addWidget(QLabel("Brightness (0-15):"), 2, 0)
-        self.t2hsb_bright_spin = QSpinBox()
-        self.t2hsb_bright_spin.setMinimum(0)
-        self.t2hsb_bright_spin.setMaximum(15)
-        self.t2hsb_bright_spin.setValue(15)
-        hsb_layout.addWidget(self.t2hsb_bright_spin, 2, 1)
-        hsb_layout.addWidget(QLabel("(0=Off, 15=Full)"), 2, 2)
+        self.t2hsb_bright_spin = self._create_spin(0, 15, 15)
+        self.t2hsb_bright_spin.setToolTip("0=Off, 15=Full")
+        hsb_layout.addRow("Brightness (0-15):", self.t2hsb_bright_spin)
 
+        hsb_group.setLayout(hsb_layout)
         layout.addWidget(hsb_group)
 
         # Send button
         self.t2hsb_send_btn = QPushButton("Send T2HSB Command")
-        self.t2hsb_send_btn.setMinimumHeight(40)
+        self.t2hsb_send_btn.setProperty("sendBtn", True)
         self.t2hsb_send_btn.clicked.connect(self._send_t2hsb_command)
         layout.addWidget(self.t2hsb_send_btn)
 
         # Color presets
-        presets_layout = QHBoxLayout()
-        presets = [
-            ("Red", 0, 255, 255),
-            ("Green", 85, 255, 255),
-            ("Blue", 170, 255, 255),
-            ("White", 0, 0, 255),
-        ]
-        self.t2hsb_preset_btns = []
-        for name, h, s, b in presets:
-            btn = QPushButton(name)
-            btn.clicked.connect(lambda checked, h=h, s=s, b=b: self._set_t2hsb_preset(h, s, b))
-            presets_layout.addWidget(btn)
-            self.t2hsb_preset_btns.append(btn)
+        presets_layout, self.t2hsb_preset_btns = self._build_preset_row(_T2HSB_PRESETS, self._set_t2hsb_preset)
         layout.addLayout(presets_layout)
 
         layout.addStretch()
 
+        # Bound value getters read by _send_t2hsb_command
+        self._t2hsb_values = (self.t2hsb_channel_spin.value, self.t2hsb_clan_spin.value, self.t2hsb_transition_spin.value,
+                              self.t2hsb_hue_spin.value, self.t2hsb_sat_spin.value, self.t2hsb_bright_spin.value)
+
         return tab
 
     def _create_t2rgb_tab(self):
@@ -633,56 +908,36 @@ class ChannelOutputCommandsGUI(QMainWindow):
 
         # RGB controls
         rgb_group = QGroupBox("RGB Color")
-        rgb_layout = QGridLayout(rgb_group)
-
-        rgb_layout.addWidget(QLabel("Red (0-31):"), 0, 0)
-        self.t2rgb_red_spin = QSpinBox()
-        self.t2rgb_red_spin.setMinimum(0)
-        self.t2rgb_red_spin.setMaximum(31)
-        self.t2rgb_red_spin.setValue(31)
-        rgb_layout.addWidget(self.t2rgb_red_spin, 0, 1)
-
-        rgb_layout.addWidget(QLabel("Green (0-31):"), 1, 0)
-        self.t2rgb_green_spin = QSpinBox()
-        self.t2rgb_green_spin.setMinimum(0)
-        self.t2rgb_green_spin.setMaximum(31)
-        self.t2rgb_green_spin.setValue(0)
-        rgb_layout.addWidget(self.t2rgb_green_spin, 1, 1)
-
-        rgb_layout.addWidget(QLabel("Blue (0-31):"), 2, 0)
-        self.t2rgb_blue_spin = QSpinBox()
-        self.t2rgb_blue_spin.setMinimum(0)
-        self.t2rgb_blue_spin.setMaximum(31)
-        self.t2rgb_blue_spin.setValue(0)
-        rgb_layout.addWidget(self.t2rgb_blue_spin, 2, 1)
+        rgb_layout = QFormLayout()
+
+        self.t2rgb_red_spin = self._create_spin(0, 31, 31)
+        rgb_layout.addRow("Red (0-31):", self.t2rgb_red_spin)
+
+        self.t2rgb_green_spin = self._create_spin(0, 31)
+        rgb_layout.addRow("Green (0-31):", self.t2rgb_green_spin)
 
+        self.t2rgb_blue_spin = self._create_spin(0, 31)
+        rgb_layout.addRow("Blue (0-31):", self.t2rgb_blue_spin)
+
+        rgb_group.setLayout(rgb_layout)
         layout.addWidget(rgb_group)
 
         # Send button
         self.t2rgb_send_btn = QPushButton("Send T2RGB Command")
-        self.t2rgb_send_btn.setMinimumHeight(40)
+        self.t2rgb_send_btn.setProperty("sendBtn", True)
         self.t2rgb_send_btn.clicked.connect(self._send_t2rgb_command)
         layout.addWidget(self.t2rgb_send_btn)
 
         # Color presets
-        presets_layout = QHBoxLayout()
-        presets = [
-            ("Red", 31, 0, 0),
-            ("Green", 0, 31, 0),
-            ("Blue", 0, 0, 31),
-            ("Yellow", 31, 31, 0),
-            ("Cyan", 0, 31, 31),
-            ("Magenta", 31, 0, 31),
-            ("White", 31, 31, 31),
-            ("Orange", 31, 16, 0),
-        ]
-        for name, r, g, b in presets:
-            btn = QPushButton(name)
-            btn.clicked.connect(lambda checked, r=r, g=g, b=b: self._set_t2rgb_preset(r, g, b))
-            presets_layout.addWidget(btn)
+        presets_layout, _ = self._build_preset_row(_T2RGB_PRESETS, self._set_t2rgb_preset)
         layout.addLayout(presets_layout)
 
         layout.addStretch()
+
+        # Bound value getters read by _send_t2rgb_command
+        self._t2rgb_values = (self.t2rgb_channel_spin.value, self.t2rgb_clan_spin.value, self.t2rgb_transition_spin.value,
+                              self.t2rgb_red_spin.value, self.t2rgb_green_spin.value, self.t2rgb_blue_spin.value)
+
         return tab
 
     def _create_t2hs_tab(self):
@@ -699,47 +954,36 @@ class ChannelOutputCommandsGUI(QMainWindow):
 
         # HS controls
         hs_group = QGroupBox("Hue/Saturation")
-        hs_layout = QGridLayout(hs_group)
-
-        hs_layout.addWidget(QLabel("Hue (0-255):"), 0, 0)
-        self.t2hs_hue_spin = QSpinBox()
-        self.t2hs_hue_spin.setMinimum(0)
-        self.t2hs_hue_spin.setMaximum(255)
-        self.t2hs_hue_spin.setValue(0)
-        hs_layout.addWidget(self.t2hs_hue_spin, 0, 1)
-        hs_layout.addWidget(QLabel("(0=Red, 85=Green, 170=Blue)"), 0, 2)
-
-        hs_layout.addWidget(QLabel("Saturation (0-15):"), 1, 0)
-        self.t2hs_sat_spin = QSpinBox()
-        self.t2hs_sat_spin.setMinimum(0)
-        self.t2hs_sat_spin.setMaximum(15)
-        self.t2hs_sat_spin.setValue(15)
-        hs_layout.addWidget(self.t2hs_sat_spin, 1, 1)
-        hs_layout.addWidget(QLabel("(0=White, 15=Full color)"), 1, 2)
+        hs_layout = QFormLayout()
 
+        self.t2hs_hue_spin = self._create_spin(0, 255)
+        self.t2hs_hue_spin.setToolTip("0=Red, 85=Green, 170=Blue")
+        hs_layout.addRow("Hue (0-255):", self.t2hs_hue_spin)
+
+        self.t2hs_sat_spin = self._create_spin(0, 15, 15)
+        self.t2hs_sat_spin.setToolTip("0=White, 15=Full color")
+        hs_layout.addRow("Saturation (0-15):", self.t2hs_sat_spin)
+
+        hs_group.setLayout(hs_layout)
         layout.addWidget(hs_group)
 
         # Send button
         self.t2hs_send_btn = QPushButton("Send T2HS Command")
-        self.t2hs_send_btn.setMinimumHeight(40)
+        self.t2hs_send_btn.setProperty("sendBtn", True)
         self.t2hs_send_btn.clicked.connect(self._send_t2hs_command)
         layout.addWidget(self.t2hs_send_btn)
 
         # Color presets
-        presets_layout = QHBoxLayout()
-        presets = [
-            ("Red", 0, 255),
-            ("Green", 85, 255),
-            ("Blue", 170, 255),
-            ("White", 0, 0),
-        ]
-        for name, h, s in presets:
-            btn = QPushButton(name)
-            btn.clicked.connect(lambda checked, h=h, s=s: self._set_t2hs_preset(h, s))
-            presets_layout.addWidget(btn)
+        presets_layout, _ = self._build_preset_row(
+            _T2HS_PRESETS, partial(self._apply_hs_preset, self.t2hs_hue_spin.setValue, self.t2hs_sat_spin.setValue))
         layout.addLayout(presets_layout)
 
         layout.addStretch()
+
+        # Bound value getters read by _send_t2hs_command
+        self._t2hs_values = (self.t2hs_channel_spin.value, self.t2hs_clan_spin.value, self.t2hs_transition_spin.value,
+                             self.t2hs_hue_spin.value, self.t2hs_sat_spin.value)
+
         return tab
 
     def _create_t2b_tab(self):
@@ -756,7 +1000,7 @@ class ChannelOutputCommandsGUI(QMainWindow):
 
         # Brightness control
         bright_group = QGroupBox("Brightness")
-        bright_layout = QVBoxLayout(bright_group)
+        bright_layout = QVBoxLayout()
 
         slider_layout = QHBoxLayout()
         slider_layout.addWidget(QLabel("Brightness:"))
@@ -764,34 +1008,33 @@ class ChannelOutputCommandsGUI(QMainWindow):
         self.t2b_slider.setMinimum(0)
         self.t2b_slider.setMaximum(255)
         self.t2b_slider.setValue(255)
-        self.t2b_slider.setTickPosition(QSlider.TicksBelow)
-        self.t2b_slider.setTickInterval(25)
         slider_layout.addWidget(self.t2b_slider)
         self.t2b_value_label = QLabel("255")
         self.t2b_value_label.setMinimumWidth(40)
         slider_layout.addWidget(self.t2b_value_label)
         bright_layout.addLayout(slider_layout)
 
-        self.t2b_slider.valueChanged.connect(lambda v: self.t2b_value_label.setText(str(v)))
+        self.t2b_slider.valueChanged.connect(self._on_t2b_slider_changed)
 
+        bright_group.setLayout(bright_layout)
         layout.addWidget(bright_group)
 
         # Send button
         self.t2b_send_btn = QPushButton("Send T2B Command")
-        self.t2b_send_btn.setMinimumHeight(40)
+        self.t2b_send_btn.setProperty("sendBtn", True)
         self.t2b_send_btn.clicked.connect(self._send_t2b_command)
         layout.addWidget(self.t2b_send_btn)
 
         # Presets
-        presets_layout = QHBoxLayout()
-        presets = [("Off", 0), ("25%", 64), ("50%", 128), ("75%", 191), ("100%", 255)]
-        for name, val in presets:
-            btn = QPushButton(name)
-            btn.clicked.connect(lambda checked, v=val: self.t2b_slider.setValue(v))
-            presets_layout.addWidget(btn)
+        presets_layout, _ = self._build_preset_row(_T2B_PRESETS, self.t2b_slider.setValue)
         layout.addLayout(presets_layout)
 
         layout.addStretch()
+
+        # Bound value getters read by _send_t2b_command
+        self._t2b_values = (self.t2b_channel_spin.value, self.t2b_clan_spin.value, self.t2b_transition_spin.value,
+                            self.t2b_slider.value)
+
         return tab
 
     def _create_t2bd_tab(self):
@@ -808,34 +1051,31 @@ class ChannelOutputCommandsGUI(QMainWindow):
 
         # Delta control
         delta_group = QGroupBox("Brightness Delta")
-        delta_layout = QGridLayout(delta_group)
+        delta_layout = QFormLayout()
 
-        delta_layout.addWidget(QLabel("Delta (-127 to +127):"), 0, 0)
-        self.t2bd_delta_spin = QSpinBox()
-        self.t2bd_delta_spin.setMinimum(-127)
-        self.t2bd_delta_spin.setMaximum(127)
-        self.t2bd_delta_spin.setValue(10)
-        delta_layout.addWidget(self.t2bd_delta_spin, 0, 1)
-        delta_layout.addWidget(QLabel("(±0.79% per step)"), 0, 2)
+        self.t2bd_delta_spin = self._create_spin(-127, 127, 10)
+        self.t2bd_delta_spin.setToolTip("±0.79% per step")
+        delta_layout.addRow("Delta (-127 to +127):", self.t2bd_delta_spin)
 
+        delta_group.setLayout(delta_layout)
         layout.addWidget(delta_group)
 
         # Send button
         self.t2bd_send_btn = QPushButton("Send T2BD Command")
-        self.t2bd_send_btn.setMinimumHeight(40)
+        self.t2bd_send_btn.setProperty("sendBtn", True)
         self.t2bd_send_btn.clicked.connect(self._send_t2bd_command)
         layout.addWidget(self.t2bd_send_btn)
 
         # Presets
-        presets_layout = QHBoxLayout()
-        presets = [("-50", -50), ("-25", -25), ("-10", -10), ("+10", 10), ("+25", 25), ("+50", 50)]
-        for name, val in presets:
-            btn = QPushButton(name)
-            btn.clicked.connect(lambda checked, v=val: self.t2bd_delta_spin.setValue(v))
-            presets_layout.addWidget(btn)
+        presets_layout, _ = self._build_preset_row(_T2BD_PRESETS, self.t2bd_delta_spin.setValue)
         layout.addLayout(presets_layout)
 
         layout.addStretch()
+
+        # Bound value getters read by _send_t2bd_command
+        self._t2bd_values = (self.t2bd_channel_spin.value, self.t2bd_clan_spin.value, self.t2bd_transition_spin.value,
+                             self.t2bd_delta_spin.value)
+
         return tab
 
     def _create_t2p_tab(self):
@@ -852,42 +1092,42 @@ class ChannelOutputCommandsGUI(QMainWindow):
 
         # Pattern selection
         pattern_group = QGroupBox("Pattern")
-        pattern_layout = QGridLayout(pattern_group)
+        pattern_layout = QFormLayout()
 
-        pattern_layout.addWidget(QLabel("Pattern ID (0-253):"), 0, 0)
-        self.t2p_pattern_spin = QSpinBox()
-        self.t2p_pattern_spin.setMinimum(0)
-        self.t2p_pattern_spin.setMaximum(253)
-        self.t2p_pattern_spin.setValue(4)
-        pattern_layout.addWidget(self.t2p_pattern_spin, 0, 1)
+        self.t2p_pattern_spin = self._create_spin(0, 253, 4)
+        pattern_layout.addRow("Pattern ID (0-253):", self.t2p_pattern_spin)
 
+        pattern_group.setLayout(pattern_layout)
         layout.addWidget(pattern_group)
 
         # Send button
         self.t2p_send_btn = QPushButton("Send T2P Command")
-        self.t2p_send_btn.setMinimumHeight(40)
+        self.t2p_send_btn.setProperty("sendBtn", True)
         self.t2p_send_btn.clicked.connect(self._send_t2p_command)
         layout.addWidget(self.t2p_send_btn)
 
         # Pattern presets
-        presets_layout = QHBoxLayout()
-        presets = [
-            ("Color Cycle", 4),
-            ("Cross Fade", 5),
-        ]
-        for name, pid in presets:
-            btn = QPushButton(name)
-            btn.clicked.connect(lambda checked, p=pid: self.t2p_pattern_spin.setValue(p))
-            presets_layout.addWidget(btn)
+        presets_layout, _ = self._build_preset_row(_T2P_PRESETS, self.t2p_pattern_spin.setValue)
         layout.addLayout(presets_layout)
 
         layout.addStretch()
+
+        # Bound value getters read by _send_t2p_command
+        self._t2p_values = (self.t2p_channel_spin.value, self.t2p_clan_spin.value, self.t2p_transition_spin.value,
+                            self.t2p_pattern_spin.value)
+
         return tab
 
     def _update_pwm_label(self, value):
-        self.pwm_value_label.setText(f"{value}%")
+        self.pwm_value_label.setText(_PCT_STR[value])
+
+    def _on_t2b_slider_changed(self, value):
+        # Only the value the slider settles on is shown, not every step of a drag
+        self._debounce("t2b_label", partial(self.t2b_value_label.setText, _I8_STR[value]),
+                       self.LABEL_DEBOUNCE_MS)
 
     def _set_t2hsb_preset(self, h, s, b):
+        """Set HSB color preset"""
         # Set reasonable defaults for clan and transition when using presets
         self.t2hsb_clan_spin.setValue(0)
         self.t2hsb_transition_spin.setValue(0)
@@ -895,125 +1135,105 @@ class ChannelOutputCommandsGUI(QMainWindow):
         self.t2hsb_sat_spin.setValue(s)
         self.t2hsb_bright_spin.setValue(b)
 
+    def _set_status(self, text):
+        """Show text in the status line; bursts of updates are coalesced into one repaint"""
+        self._pending_status_text = text
+        if not self._status_text_timer.isActive():
+            self._status_text_timer.start()
+
+    def _flush_status_text(self):
+        """Apply the most recent status line text"""
+        if self._pending_status_text is not None:
+            self.status_label.setText(self._pending_status_text)
+            self._pending_status_text = None
+
     def _log(self, message):
-        """Add message to log"""
-        self.log_text.append(message)
+        """Add message to log (written to the widget by _flush_log)"""
+        self._log_buffer.append(message)
 
-    def _send_binary_command(self, state):
-        """Send Binary channel control"""
-        if not self.poco:
-            self.status_label.setText("Not connected")
+    def _flush_log(self):
+        """Append buffered log lines; the widget keeps only the most recent LOG_MAX_LINES"""
+        if not self._log_buffer:
             return
+        self.log_text.appendPlainText("\n".join(self._log_buffer))
+        self._log_buffer.clear()
+        scroll_bar = self.log_text.verticalScrollBar()
+        scroll_bar.setValue(scroll_bar.maximum())
 
+    def _send_binary_command(self, state):
+        """Send Binary channel control"""
         channel = self.bin_channel_spin.value()
         state_name = "ON" if state else "OFF"
-
-        try:
-            self.poco.send_binary_channel(channel, state)
-            self._log(f"Channel {channel} -> {state_name}")
-            self.status_label.setText(f"Channel {channel}: Binary {state_name}")
-        except Exception as e:
-            self._log(f"ERROR: {str(e)}")
-            self.status_label.setText(f"Error: {str(e)}")
+        self._send("binary", (channel, state),
+                   f"Channel {channel} -> {state_name}",
+                   f"Channel {channel}: Binary {state_name}")
 
     def _send_pwm_command_rate_limited(self):
-        """Send PWM output command through rate limiter"""
+        """Send PWM output command, coalescing rapid slider changes"""
         if not self.poco:
             return
 
-        try:
-            channel = self.pwm_channel_spin.value()
-            duty_cycle_percent = self.pwm_slider.value()
-
-            # Use rate limiter to prevent CAN bus flooding
-            self.pwm_rate_limiter.queue_command(
-                lambda: self._execute_pwm_command(channel, duty_cycle_percent)
-            )
-        except Exception as e:
-            self._log(f"ERROR queueing PWM: {str(e)}")
+        self._pwm_pending = self.pwm_slider.value()
+        if not self._pwm_timer.isActive():
+            self._flush_pwm()
 
-    def _execute_pwm_command(self, channel, duty_cycle_percent):
-        """Actually execute the PWM command (called by rate limiter)"""
-        try:
-            # Convert percentage to 0-255 range for protocol
-            duty_cycle_raw = int((duty_cycle_percent / 100.0) * 255)
+    def _flush_pwm(self):
+        """Send the latest pending PWM value, then hold off further sends for one interval"""
+        if self._pwm_pending is None or not self.poco:
+            self._pwm_pending = None
+            return
 
-            self.poco.send_pwm_channel(channel, duty_cycle_raw)
-            self._log(f"Channel {channel} -> PWM {duty_cycle_percent}%")
-            self.status_label.setText(f"Channel {channel}: PWM {duty_cycle_percent}%")
-        except Exception as e:
-            self._log(f"ERROR: {str(e)}")
-            self.status_label.setText(f"Error: {str(e)}")
+        duty_cycle_percent, self._pwm_pending = self._pwm_pending, None
+        self._execute_pwm_command(self.pwm_channel_spin.value(), duty_cycle_percent)
+        self._pwm_timer.start()
 
-    def _set_pwm_preset(self, percent):
-        """Set PWM slider to preset value and send command"""
-        self.pwm_slider.setValue(percent)
-        # Command will be sent automatically via valueChanged signal
+    def _execute_pwm_command(self, channel, duty_cycle_percent):
+        """Actually execute the PWM command (called by _flush_pwm)"""
+        # Convert percentage to 0-255 range for protocol (rounded, integer math)
+        duty_cycle_raw = (duty_cycle_percent * 255 + 50) // 100
+        self._send("pwm", (channel, duty_cycle_raw),
+                   f"Channel {channel} -> PWM {duty_cycle_percent}%",
+                   f"Channel {channel}: PWM {duty_cycle_percent}%")
 
     def _send_raw_pli_command(self):
         """Send Raw PLI message"""
         if not self.poco:
-            self.status_label.setText("Not connected")
+            self._set_status("Not connected")
             return
 
         channel = self.raw_channel_spin.value()
-        hex_str = self.raw_pli_edit.text().strip()
-
-        try:
-            # Convert hex string to integer
-            pli_message = int(hex_str, 16)
+        hex_str = self.raw_pli_edit.text()
 
-            self.poco.send_pli_raw(channel, pli_message)
-            self._log(f"Channel {channel} -> Raw PLI 0x{hex_str}")
-            self.status_label.setText(f"Sent raw PLI message to channel {channel}")
-        except ValueError:
+        if self._raw_pli_value is None:
             self._log(f"ERROR: Invalid hex value: {hex_str}")
-            self.status_label.setText("Error: Invalid hex value")
-        except Exception as e:
-            self._log(f"ERROR: {str(e)}")
-            self.status_label.setText(f"Error: {str(e)}")
-
-    def _send_t2hsb_command(self):
-        """Send T2HSB command"""
-        if not self.poco:
-            self.status_label.setText("Not connected")
+            self._set_status("Error: Invalid hex value")
             return
 
-        channel = self.t2hsb_channel_spin.value()
-        clan = self.t2hsb_clan_spin.value()
-        transition = self.t2hsb_transition_spin.value()
-        hue = self.t2hsb_hue_spin.value()
-        sat = self.t2hsb_sat_spin.value()
-        bright = self.t2hsb_bright_spin.value()
+        self._send("raw", (channel, self._raw_pli_value),
+                   f"Channel {channel} -> Raw PLI 0x{hex_str}",
+                   f"Sent raw PLI message to channel {channel}")
 
-        try:
-            self.poco.send_pli_t2hsb(channel, hue, sat, bright, clan, transition)
-            self._log(f"Channel {channel} -> T2HSB(Clan={clan}, Trans={transition}, H={hue}, S={sat}, B={bright})")
-            self.status_label.setText(f"Channel {channel}: T2HSB command sent")
-        except Exception as e:
-            self._log(f"ERROR: {str(e)}")
-            self.status_label.setText(f"Error: {str(e)}")
+    def _on_raw_pli_text_changed(self, hex_str):
+        """Parse the raw PLI field once per edit instead of on every send"""
+        # The validator only lets 1-8 hex digits through as acceptable input
+        if self.raw_pli_edit.hasAcceptableInput():
+            self._raw_pli_value = int.from_bytes(bytes.fromhex(hex_str.rjust(8, '0')), 'big')
+        else:
+            self._raw_pli_value = None
+
+    def _send_t2hsb_command(self):
+        """Send T2HSB command"""
+        channel, clan, transition, hue, sat, bright = [get() for get in self._t2hsb_values]
+        self._send("t2hsb", (channel, hue, sat, bright, clan, transition),
+                   f"Channel {channel} -> T2HSB(Clan={clan}, Trans={transition}, H={hue}, S={sat}, B={bright})",
+                   f"Channel {channel}: T2HSB command sent")
 
     def _send_t2rgb_command(self):
         """Send T2RGB command"""
-        if not self.poco:
-            self.status_label.setText("Not connected")
-            return
-
-        channel = self.t2rgb_channel_spin.value()
-        clan = self.t2rgb_clan_spin.value()
-        transition = self.t2rgb_transition_spin.value()
-        red = self.t2rgb_red_spin.value()
-        green = self.t2rgb_green_spin.value()
-        blue = self.t2rgb_blue_spin.value()
-
-        try:
-            self.poco.send_pli_t2rgb(channel, red, green, blue, clan, transition)
-            self._log(f"Channel {channel} -> T2RGB(Clan={clan}, Trans={transition}, R={red}, G={green}, B={blue})")
-            self.status_label.setText(f"Channel {channel}: T2RGB command sent")
-        except Exception as e:
-            self._log(f"ERROR: {str(e)}")
-            self.status_label.setText(f"Error: {str(e)}")
+        channel, clan, transition, red, green, blue = [get() for get in self._t2rgb_values]
+        self._send("t2rgb", (channel, red, green, blue, clan, transition),
+                   f"Channel {channel} -> T2RGB(Clan={clan}, Trans={transition}, R={red}, G={green}, B={blue})",
+                   f"Channel {channel}: T2RGB command sent")
 
     def _set_t2rgb_preset(self, r, g, b):
         """Set RGB color preset"""
@@ -1023,95 +1243,51 @@ class ChannelOutputCommandsGUI(QMainWindow):
 
     def _send_t2hs_command(self):
         """Send T2HS command"""
-        if not self.poco:
-            self.status_label.setText("Not connected")
-            return
+        channel, clan, transition, hue, sat = [get() for get in self._t2hs_values]
+        self._send("t2hs", (channel, hue, sat, clan, transition),
+                   f"Channel {channel} -> T2HS(Clan={clan}, Trans={transition}, H={hue}, S={sat})",
+                   f"Channel {channel}: T2HS command sent")
 
-        channel = self.t2hs_channel_spin.value()
-        clan = self.t2hs_clan_spin.value()
-        transition = self.t2hs_transition_spin.value()
-        hue = self.t2hs_hue_spin.value()
-        sat = self.t2hs_sat_spin.value()
-
-        try:
-            self.poco.send_pli_t2hs(channel, hue, sat, clan, transition)
-            self._log(f"Channel {channel} -> T2HS(Clan={clan}, Trans={transition}, H={hue}, S={sat})")
-            self.status_label.setText(f"Channel {channel}: T2HS command sent")
-        except Exception as e:
-            self._log(f"ERROR: {str(e)}")
-            self.status_label.setText(f"Error: {str(e)}")
-
-    def _set_t2hs_preset(self, h, s):
-        """Set hue/sat preset"""
-        self.t2hs_hue_spin.setValue(h)
-        self.t2hs_sat_spin.setValue(s)
+    @staticmethod
+    def _apply_hs_preset(set_hue, set_sat, h, s, _checked=False):
+        """Set hue/sat preset through the spin boxes' bound setValue methods"""
+        set_hue(h)
+        set_sat(s)
 
     def _send_t2b_command(self):
         """Send T2B command"""
-        if not self.poco:
-            self.status_label.setText("Not connected")
-            return
-
-        channel = self.t2b_channel_spin.value()
-        clan = self.t2b_clan_spin.value()
-        transition = self.t2b_transition_spin.value()
-        brightness = self.t2b_slider.value()
-
-        try:
-            self.poco.send_pli_t2b(channel, brightness, clan, transition)
-            self._log(f"Channel {channel} -> T2B(Clan={clan}, Trans={transition}, Brightness={brightness})")
-            self.status_label.setText(f"Channel {channel}: T2B command sent")
-        except Exception as e:
-            self._log(f"ERROR: {str(e)}")
-            self.status_label.setText(f"Error: {str(e)}")
+        channel, clan, transition, brightness = [get() for get in self._t2b_values]
+        self._send("t2b", (channel, brightness, clan, transition),
+                   f"Channel {channel} -> T2B(Clan={clan}, Trans={transition}, Brightness={brightness})",
+                   f"Channel {channel}: T2B command sent")
 
     def _send_t2bd_command(self):
         """Send T2BD command"""
-        if not self.poco:
-            self.status_label.setText("Not connected")
-            return
-
-        channel = self.t2bd_channel_spin.value()
-        clan = self.t2bd_clan_spin.value()
-        transition = self.t2bd_transition_spin.value()
-        delta = self.t2bd_delta_spin.value()
-
-        try:
-            self.poco.send_pli_t2bd(channel, delta, clan, transition)
-            self._log(f"Channel {channel} -> T2BD(Clan={clan}, Trans={transition}, Delta={delta})")
-            self.status_label.setText(f"Channel {channel}: T2BD command sent")
-        except Exception as e:
-            self._log(f"ERROR: {str(e)}")
-            self.status_label.setText(f"Error: {str(e)}")
+        channel, clan, transition, delta = [get() for get in self._t2bd_values]
+        self._send("t2bd", (channel, delta, clan, transition),
+                   f"Channel {channel} -> T2BD(Clan={clan}, Trans={transition}, Delta={delta})",
+                   f"Channel {channel}: T2BD command sent")
 
     def _send_t2p_command(self):
         """Send T2P command"""
-        if not self.poco:
-            self.status_label.setText("Not connected")
-            return
-
-        channel = self.t2p_channel_spin.value()
-        clan = self.t2p_clan_spin.value()
-        transition = self.t2p_transition_spin.value()
-        pattern = self.t2p_pattern_spin.value()
-
-        try:
-            self.poco.send_pli_t2p(channel, pattern, clan, transition)
-            self._log(f"Channel {channel} -> T2P(Clan={clan}, Trans={transition}, Pattern={pattern})")
-            self.status_label.setText(f"Channel {channel}: T2P command sent")
-        except Exception as e:
-            self._log(f"ERROR: {str(e)}")
-            self.status_label.setText(f"Error: {str(e)}")
+        channel, clan, transition, pattern = [get() for get in self._t2p_values]
+        self._send("t2p", (channel, pattern, clan, transition),
+                   f"Channel {channel} -> T2P(Clan={clan}, Trans={transition}, Pattern={pattern})",
+                   f"Channel {channel}: T2P command sent")
 
     def closeEvent(self, event):
         """Clean up CAN connection when window closes"""
         if self.poco:
-            self.poco.remove_channel_status_callback(self._on_channel_status_update)
+            self.poco.remove_channel_status_callback(self._status_callback)
+        self._status_timer.stop()
         self.can_widget.cleanup()
         event.accept()
 
 
 def main():
+    # The widgets here never overlap, so skip Qt's opaque sibling region
+    # subtraction on every update; must be set before QApplication exists
+    os.environ.setdefault("QT_NO_SUBTRACTOPAQUESIBLINGS", "1")
     app = QApplication(sys.argv)
     app.setStyle('Fusion')
     window = ChannelOutputCommandsGUI()
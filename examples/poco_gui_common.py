@@ -6,19 +6,25 @@ Shared widgets and utilities for Poco CAN GUI applications.
 """
 
 import os
+import re
+import json
 import logging
 import time
+from collections import deque
 from PyQt5.QtCore import Qt, pyqtSignal, QSettings, QTimer
 from PyQt5.QtWidgets import (QWidget, QHBoxLayout, QVBoxLayout, QLabel, QPushButton,
                              QFrame, QComboBox, QCheckBox, QSpinBox, QDialog,
-                             QListWidget, QListWidgetItem, QMessageBox)
-from PyQt5.QtGui import QFont
-
-from poco_can.poco_can_interface import PocoCANInterfaceBase
+                             QListWidget, QListWidgetItem, QListView,
+                             QAbstractItemView, QMessageBox)
+from PyQt5.QtGui import QFont, QColor
 
 # Module logger
 logger = logging.getLogger(__name__)
 
+# Poco address formats accepted by CANConnectionWidget._parse_poco_address
+_POCO_HEX_RE = re.compile(r'0x([0-9A-Fa-f]+)')
+_POCO_DEC_RE = re.compile(r'\d+')
+
 # Note: qRegisterMetaType is no longer needed in modern PyQt5
 # Type registration happens automatically for standard Qt types
 
@@ -53,14 +59,20 @@ class CommandRateLimiter:
 
     First command sends immediately. Subsequent commands within the rate limit
     period are queued and sent after the delay (latest command wins).
-    Useful for slider controls that generate many rapid events.
+    Useful for slider controls that generate many rapid events. The default
+    delay of 16ms (one display frame) keeps the device tracking the slider;
+    use a longer delay where the bus or device needs it.
+
+    Connect the slider's sliderReleased signal to flush() so the final
+    value is sent as soon as the user lets go, not after the delay.
 
     Usage:
-        rate_limiter = CommandRateLimiter(delay_ms=100)
+        rate_limiter = CommandRateLimiter(delay_ms=16)
         rate_limiter.queue_command(lambda: send_pwm_command(channel, value))
+        slider.sliderReleased.connect(rate_limiter.flush)
     """
 
-    def __init__(self, delay_ms=100):
+    def __init__(self, delay_ms=16):
         """
         Initialize rate limiter.
 
@@ -68,63 +80,72 @@ class CommandRateLimiter:
             delay_ms: Delay between commands in milliseconds
         """
         self.delay_ms = delay_ms
+        self.delay_ns = delay_ms * 1_000_000
+        # Monotonic time of the last command sent; the timer only runs while a
+        # command is queued, so idle periods cost no timer events
+        self.last_send_ns = 0
         self.timer = QTimer()
         self.timer.setSingleShot(True)
         self.timer.timeout.connect(self._send_queued_command)
         self.queued_command = None
-        self.first_command = True
         self.logger = logging.getLogger(f"{__name__}.CommandRateLimiter")
 
     def queue_command(self, command_func):
         """
         Queue a command to be sent immediately or after rate limit delay.
 
-        If no timer is running, send immediately and start timer.
-        If timer is running, queue for delayed sending (latest command wins).
+        If the last command was sent at least delay_ms ago, send immediately.
+        Otherwise queue for delayed sending (latest command wins).
 
         Args:
             command_func: Callable to execute (should be a lambda or function with no args)
         """
-        if not self.timer.isActive():
-            # No timer running, send immediately and start timer
-            try:
-                self.logger.debug(f"Sending command immediately (delay_ms={self.delay_ms})")
-                command_func()
-            except Exception as e:
-                self.logger.error(f"Rate limiter command error: {e}")
-
-            # Start timer to enforce rate limit for next command
-            self.logger.debug(f"Starting timer for {self.delay_ms}ms")
-            self.timer.start(self.delay_ms)
+        timer = self.timer
+        timer_active = timer.isActive()
+        elapsed_ns = time.monotonic_ns() - self.last_send_ns
+        if not timer_active and elapsed_ns >= self.delay_ns:
+            # Rate limit period is over, send immediately
+            self.logger.debug("Sending command immediately (delay_ms=%d)", self.delay_ms)
+            self._run(command_func)
         else:
-            # Timer is running, queue this command (overwrites any existing queued command)
-            self.logger.debug(f"Queueing command (timer still active)")
+            # Within the rate limit period, queue this command (overwrites any existing queued command)
+            self.logger.debug("Queueing command (rate limit period active)")
             self.queued_command = command_func
+            if not timer_active:
+                remaining_ms = max(1, (self.delay_ns - elapsed_ns) // 1_000_000)
+                self.logger.debug("Starting timer for %dms", remaining_ms)
+                timer.start(remaining_ms)
+
+    def set_delay_ms(self, delay_ms):
+        """Change the delay between commands, applying it to a pending command too"""
+        self.delay_ms = delay_ms
+        self.delay_ns = delay_ms * 1_000_000
+        if self.timer.isActive():
+            elapsed_ns = time.monotonic_ns() - self.last_send_ns
+            self.timer.start(max(1, (self.delay_ns - elapsed_ns) // 1_000_000))
+
+    def _run(self, command_func):
+        """Execute a command and start a new rate limit period"""
+        try:
+            command_func()
+        except Exception as e:
+            self.logger.error("Rate limiter command error: %s", e)
+        self.last_send_ns = time.monotonic_ns()
 
     def _send_queued_command(self):
         """Internal method called when timer expires"""
-        self.logger.debug(f"Timer expired (delay was {self.delay_ms}ms)")
-        if self.queued_command:
-            # Send the queued command
-            try:
-                self.logger.debug(f"Sending queued command")
-                self.queued_command()
-            except Exception as e:
-                self.logger.error(f"Rate limiter command error: {e}")
-            finally:
-                self.queued_command = None
-
-            # Restart timer for next rate limit period
-            self.logger.debug(f"Restarting timer for {self.delay_ms}ms")
-            self.timer.start(self.delay_ms)
-        else:
-            self.logger.debug(f"No queued command, timer stops")
-        # If no queued command, timer stops naturally (don't restart)
+        self.logger.debug("Timer expired (delay was %dms)", self.delay_ms)
+        command_func, self.queued_command = self.queued_command, None
+        if command_func:
+            self.logger.debug("Sending queued command")
+            self._run(command_func)
+        # The next command checks the deadline itself; no timer restart needed
 
     def flush(self):
         """Immediately send any queued command and stop the timer"""
-        if self.timer.isActive():
-            self.timer.stop()
+        timer = self.timer
+        if timer.isActive():
+            timer.stop()
             self._send_queued_command()
 
 
@@ -135,12 +156,41 @@ class DeviceDiscoveryDialog(QDialog):
     Sends an ENUMERATE_REQUEST broadcast and displays responding devices.
     """
 
+    # Interval at which queued responses are added to the device list
+    DEVICE_FLUSH_INTERVAL_MS = 50
+
+    # Discovery ends DISCOVERY_IDLE_S after the last response once a device
+    # has answered, and after DISCOVERY_TIMEOUT_S at the latest
+    DISCOVERY_POLL_MS = 250
+    DISCOVERY_IDLE_S = 0.5
+    DISCOVERY_TIMEOUT_S = 3.0
+
+    # Device list row: address, address, device ID, channels, protocol version, expander role
+    _ROW_FORMAT = ("Address: 0x%02X (%d)  |  Device ID: 0x%06X  |  Channels: %d  |  "
+                   "Protocol Ver: %d  |  Expander Role: %s")
+
     def __init__(self, poco_interface, parent=None):
         super().__init__(parent)
         self.poco = poco_interface
         self.selected_address = None
+        # The one callback object registered with and removed from the interface
+        self._enum_cb = self._on_device_discovered
+        self._enum_cb_registered = False
         self.discovery_timer = QTimer()
-        self.discovery_timer.timeout.connect(self._discovery_timeout)
+        self.discovery_timer.timeout.connect(self._check_discovery_done)
+        self._discovery_start = 0.0
+        self._last_discovery = 0.0
+        # (address, device_info) pairs shown by preload() until the next scan replaces them
+        self._preloaded_devices = None
+        # Whether the dialog has sent an enumerate request
+        self.scanned = False
+
+        # Responses arrive on the CAN thread; they are queued there and added
+        # to the list on the GUI thread in batches
+        self._pending_devices = deque()
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setInterval(self.DEVICE_FLUSH_INTERVAL_MS)
+        self._flush_timer.timeout.connect(self._flush_discovered)
         self._setup_ui()
 
     def _setup_ui(self):
@@ -158,6 +208,12 @@ class DeviceDiscoveryDialog(QDialog):
 
         # Device list
         self.device_list = QListWidget()
+        # Every row has the same one-line format: size one row for all of them,
+        # and lay out long result lists in batches
+        self.device_list.setUniformItemSizes(True)
+        self.device_list.setLayoutMode(QListView.Batched)
+        self.device_list.setBatchSize(32)
+        self.device_list.setSelectionMode(QAbstractItemView.SingleSelection)
         self.device_list.itemDoubleClicked.connect(self._on_device_double_clicked)
         layout.addWidget(self.device_list)
 
@@ -185,15 +241,45 @@ class DeviceDiscoveryDialog(QDialog):
 
         layout.addLayout(button_row)
 
-        # Connect to enumeration callback
-        self.poco.add_enumeration_callback(self._on_device_discovered)
+        # Connect to enumeration callback (removed again by _release_enumeration_callback)
+        self.poco.add_enumeration_callback(self._enum_cb)
+        self._enum_cb_registered = True
+
+        # Start discovery automatically unless preload() supplied the devices
+        QTimer.singleShot(100, self._auto_start_discovery)
 
-        # Start discovery automatically
-        QTimer.singleShot(100, self._start_discovery)
+    def preload(self, devices):
+        """
+        Show devices from a recent discovery instead of scanning the bus.
+        Rescan still starts a fresh discovery.
+
+        Args:
+            devices: Dict mapping CAN address -> device_info dict
+        """
+        self._preloaded_devices = sorted(devices.items())
+        for can_address, device_info in self._preloaded_devices:
+            self._on_device_discovered(can_address, device_info)
+        self._flush_discovered()
+        self.status_label.setText(f"Showing {self.device_list.count()} recently found device(s). "
+                                  "Rescan to refresh.")
+
+    def get_devices_sorted(self):
+        """Get the devices listed in the dialog as (CAN address, device_info) pairs by address."""
+        if self._preloaded_devices is not None:
+            return list(self._preloaded_devices)
+        return self.poco.get_discovered_devices_sorted()
+
+    def _auto_start_discovery(self):
+        """Initial discovery, skipped when preload() already filled the list."""
+        if self._preloaded_devices is None:
+            self._start_discovery()
 
     def _start_discovery(self):
         """Start device discovery process."""
         # Clear previous results
+        self._preloaded_devices = None
+        self.scanned = True
+        self._pending_devices.clear()
         self.device_list.clear()
         self.poco.clear_discovered_devices()
         self.selected_address = None
@@ -203,15 +289,27 @@ class DeviceDiscoveryDialog(QDialog):
         # Send enumerate request
         try:
             self.poco.send_enumerate_request()
-            # Wait for responses (3 seconds timeout)
-            self.discovery_timer.start(3000)
+            # Wait for responses, see _check_discovery_done
+            self._discovery_start = self._last_discovery = time.monotonic()
+            self.discovery_timer.start(self.DISCOVERY_POLL_MS)
+            self._flush_timer.start()
         except Exception as e:
             self.status_label.setText(f"Error: {e}")
             QMessageBox.critical(self, "Discovery Error", f"Failed to send enumerate request:\n{e}")
 
+    def _check_discovery_done(self):
+        """End discovery once responses have stopped arriving, or at the timeout."""
+        self._flush_discovered()
+        now = time.monotonic()
+        if ((self.device_list.count() and now - self._last_discovery >= self.DISCOVERY_IDLE_S)
+                or now - self._discovery_start >= self.DISCOVERY_TIMEOUT_S):
+            self._discovery_timeout()
+
     def _discovery_timeout(self):
         """Called when discovery timeout expires."""
         self.discovery_timer.stop()
+        self._flush_timer.stop()
+        self._flush_discovered()
 
         device_count = self.device_list.count()
         if device_count == 0:
@@ -220,23 +318,35 @@ class DeviceDiscoveryDialog(QDialog):
             self.status_label.setText(f"Found {device_count} device(s). Double-click to select.")
 
     def _on_device_discovered(self, can_address, device_info):
-        """Called when a device responds to enumeration request."""
-        # Create list item with device info
-        text = (f"Address: 0x{can_address:02X} ({can_address})  |  "
-                f"Device ID: 0x{device_info['device_id']:06X}  |  "
-                f"Channels: {device_info['num_channels']}  |  "
-                f"Protocol Ver: {device_info['protocol_version']}  |  "
-                f"Expander Role: {device_info['expander_role']}")
-
-        item = QListWidgetItem(text)
-        item.setData(Qt.UserRole, can_address)  # Store address in item data
-        self.device_list.addItem(item)
+        """Called (on the CAN thread) when a device responds to enumeration request."""
+        # Create list item text with device info; the item itself is created by _flush_discovered
+        text = self._ROW_FORMAT % (can_address, can_address, device_info['device_id'],
+                                   device_info['num_channels'], device_info['protocol_version'],
+                                   device_info['expander_role'])
+        self._pending_devices.append((text, can_address))
+        self._last_discovery = time.monotonic()
+
+    def _flush_discovered(self):
+        """Add queued device responses to the list in one batch."""
+        if not self._pending_devices:
+            return
+
+        first_device = self.device_list.count() == 0
+        self.device_list.setUpdatesEnabled(False)
+        try:
+            while self._pending_devices:
+                text, can_address = self._pending_devices.popleft()
+                item = QListWidgetItem(text)
+                item.setData(Qt.UserRole, can_address)  # Store address in item data
+                self.device_list.addItem(item)
+        finally:
+            self.device_list.setUpdatesEnabled(True)
 
         # Update status
         self.status_label.setText(f"Found {self.device_list.count()} device(s)...")
 
         # Enable selection when first device appears
-        if self.device_list.count() == 1:
+        if first_device:
             self.device_list.setCurrentRow(0)
             self.select_btn.setEnabled(True)
 
@@ -256,92 +366,23 @@ class DeviceDiscoveryDialog(QDialog):
         """Get the selected device address."""
         return self.selected_address
 
-    def closeEvent(self, event):
-        """Cleanup when dialog closes."""
+    def _release_enumeration_callback(self):
+        """Stop discovery and unregister from the interface (safe to call more than once)."""
         self.discovery_timer.stop()
-        self.poco.remove_enumeration_callback(self._on_device_discovered)
-        super().closeEvent(event)
+        self._flush_timer.stop()
+        if self._enum_cb_registered:
+            self.poco.remove_enumeration_callback(self._enum_cb)
+            self._enum_cb_registered = False
 
+    def done(self, result):
+        """Cleanup when the dialog is accepted or rejected."""
+        self._release_enumeration_callback()
+        super().done(result)
 
-class CANConnectionWidget(QFrame):
-    """
-    Rate limiter for commands with immediate sending and subsequent rate limiting.
-
-    First command sends immediately. Subsequent commands within the rate limit
-    period are queued and sent after the delay (latest command wins).
-    Useful for slider controls that generate many rapid events.
-
-    Usage:
-        rate_limiter = CommandRateLimiter(delay_ms=100)
-        rate_limiter.queue_command(lambda: send_pwm_command(channel, value))
-    """
-
-    def __init__(self, delay_ms=100):
-        """
-        Initialize rate limiter.
-
-        Args:
-            delay_ms: Delay between commands in milliseconds
-        """
-        self.delay_ms = delay_ms
-        self.timer = QTimer()
-        self.timer.setSingleShot(True)
-        self.timer.timeout.connect(self._send_queued_command)
-        self.queued_command = None
-        self.first_command = True
-        self.logger = logging.getLogger(f"{__name__}.CommandRateLimiter")
-
-    def queue_command(self, command_func):
-        """
-        Queue a command to be sent immediately or after rate limit delay.
-
-        If no timer is running, send immediately and start timer.
-        If timer is running, queue for delayed sending (latest command wins).
-
-        Args:
-            command_func: Callable to execute (should be a lambda or function with no args)
-        """
-        if not self.timer.isActive():
-            # No timer running, send immediately and start timer
-            try:
-                self.logger.debug(f"Sending command immediately (delay_ms={self.delay_ms})")
-                command_func()
-            except Exception as e:
-                self.logger.error(f"Rate limiter command error: {e}")
-
-            # Start timer to enforce rate limit for next command
-            self.logger.debug(f"Starting timer for {self.delay_ms}ms")
-            self.timer.start(self.delay_ms)
-        else:
-            # Timer is running, queue this command (overwrites any existing queued command)
-            self.logger.debug(f"Queueing command (timer still active)")
-            self.queued_command = command_func
-
-    def _send_queued_command(self):
-        """Internal method called when timer expires"""
-        self.logger.debug(f"Timer expired (delay was {self.delay_ms}ms)")
-        if self.queued_command:
-            # Send the queued command
-            try:
-                self.logger.debug(f"Sending queued command")
-                self.queued_command()
-            except Exception as e:
-                self.logger.error(f"Rate limiter command error: {e}")
-            finally:
-                self.queued_command = None
-
-            # Restart timer for next rate limit period
-            self.logger.debug(f"Restarting timer for {self.delay_ms}ms")
-            self.timer.start(self.delay_ms)
-        else:
-            self.logger.debug(f"No queued command, timer stops")
-        # If no queued command, timer stops naturally (don't restart)
-
-    def flush(self):
-        """Immediately send any queued command and stop the timer"""
-        if self.timer.isActive():
-            self.timer.stop()
-            self._send_queued_command()
+    def closeEvent(self, event):
+        """Cleanup when dialog closes."""
+        self._release_enumeration_callback()
+        super().closeEvent(event)
 
 
 class CANConnectionWidget(QFrame):
@@ -362,6 +403,33 @@ class CANConnectionWidget(QFrame):
     disconnected = pyqtSignal()
     connection_failed = pyqtSignal(str)
 
+    # Emitted from the CAN thread when a device answers an enumerate request
+    _device_confirmed = pyqtSignal(int)
+
+    # Text color of dropdown entries restored from the device cache
+    TENTATIVE_DEVICE_COLOR = QColor("#888888")
+
+    # Maximum number of combo texts kept by _parse_poco_address
+    ADDR_PARSE_CACHE_SIZE = 32
+
+    # Quiet period after the last settings change before it is written
+    SETTINGS_SAVE_DELAY_MS = 250
+
+    # Minimum spacing of device polls triggered by Poco address changes
+    ADDRESS_POLL_DELAY_MS = 150
+
+    # Reopening Discover Devices within this time shows the previous result
+    DISCOVERY_CACHE_TTL_S = 30.0
+
+    # Connection status indicator style, selected by its "status" property.
+    # Set on the label itself, so a status change only re-matches these rules.
+    _STATUS_QSS = """
+        QLabel { font-size: 16px; }
+        QLabel[status="connected"] { color: #00ff00; }
+        QLabel[status="disconnected"] { color: #ff0000; }
+        QLabel[status="unknown"] { color: #808080; }
+    """
+
     def __init__(self, settings_org="Lumitec", settings_app="PocoCANApp", parent=None):
         super().__init__(parent)
         self.poco = None
@@ -376,6 +444,43 @@ class CANConnectionWidget(QFrame):
         self.connection_active = False
         self.poll_timer = QTimer()
         self.poll_timer.timeout.connect(self._poll_poco_device)
+        # self.poco.send_enumerate_request while connected, see _set_poco()
+        self._send_enumerate = None
+        # Address changes poll the new device; typing an address changes it per keystroke
+        self._poll_limiter = CommandRateLimiter(delay_ms=self.ADDRESS_POLL_DELAY_MS)
+
+        # Parsed Poco address per combo text, see _parse_poco_address
+        self._addr_parse_cache = {}
+
+        # Current source and Poco addresses, kept up to date from the combos
+        self._source_addr_cached = 0
+        self._poco_addr_cached = 255
+
+        # CAN interface names found by _enumerate_can_interfaces
+        self._cached_interfaces = None
+
+        # Whether _on_enumerate_callback is registered with self.poco
+        self._enum_cb_registered = False
+
+        # (interface, channel, source address), time.monotonic() and devices of
+        # the last discovery, see _discover_poco_devices
+        self._discovery_cache = None
+
+        # Addresses restored from the device cache that no device has confirmed yet
+        self._tentative_addrs = set()
+        self._device_confirmed.connect(self._promote_cached_device)
+
+        # Settings are written once the combos stop changing (e.g. while typing)
+        self._save_timer = QTimer(self)
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(self.SETTINGS_SAVE_DELAY_MS)
+        self._save_timer.timeout.connect(self._do_save_settings)
+
+        # The channel combo is editable; its device cache is reloaded once typing stops
+        self._bus_change_timer = QTimer(self)
+        self._bus_change_timer.setSingleShot(True)
+        self._bus_change_timer.setInterval(self.SETTINGS_SAVE_DELAY_MS)
+        self._bus_change_timer.timeout.connect(self._reload_device_cache)
 
         self._setup_ui()
         self._apply_stylesheet()
@@ -485,6 +590,8 @@ class CANConnectionWidget(QFrame):
         self.poco_addr_combo = QComboBox()
         self.poco_addr_combo.setEditable(True)
         self.poco_addr_combo.addItems(["0xFF (Broadcast)", "0x21 (33)", "0x82 (130)"])
+        for index, addr in enumerate((0xFF, 0x21, 0x82)):
+            self.poco_addr_combo.setItemData(index, addr, Qt.UserRole)
         self.poco_addr_combo.setCurrentText("0xFF (Broadcast)")
         self.poco_addr_combo.setToolTip("Target Poco device address (0-253: specific device, 255: broadcast)")
         poco_row.addWidget(self.poco_addr_combo)
@@ -516,6 +623,7 @@ class CANConnectionWidget(QFrame):
         self.connection_status = QLabel("●")
         self.connection_status.setObjectName("connectionStatus")
         self.connection_status.setProperty("status", "unknown")
+        self.connection_status.setStyleSheet(self._STATUS_QSS)
         self.connection_status.setToolTip("Connection status: Green=Connected, Red=Disconnected, Gray=Unknown")
         status_row.addWidget(self.connection_status)
 
@@ -548,6 +656,9 @@ class CANConnectionWidget(QFrame):
         saved_source_addr = self.settings.value("source_address", "253")
         self.source_addr_combo.setCurrentText(saved_source_addr)
 
+        # Offer the devices found last session before the bus is even opened
+        self._load_device_cache()
+
         saved_poco_addr = self.settings.value("poco_address", "0xFF (Broadcast)")
         self.poco_addr_combo.setCurrentText(saved_poco_addr)
 
@@ -556,6 +667,13 @@ class CANConnectionWidget(QFrame):
         self.auto_reconnect_cb.setChecked(auto_reconnect)
         self.auto_reconnect = auto_reconnect
 
+        # Parsed addresses for get_source_address()/get_poco_address(); connected
+        # first so that the handlers below already see the new values
+        self._refresh_source_addr_cache()
+        self._refresh_poco_addr_cache()
+        self.source_addr_combo.currentTextChanged.connect(self._refresh_source_addr_cache)
+        self.poco_addr_combo.currentTextChanged.connect(self._refresh_poco_addr_cache)
+
         # Connect signals to save settings when changed
         self.interface_combo.currentTextChanged.connect(self._save_settings)
         self.channel_combo.currentTextChanged.connect(self._save_settings)
@@ -565,18 +683,115 @@ class CANConnectionWidget(QFrame):
         # Connect signal to update poco_address when dropdown changes
         self.poco_addr_combo.currentTextChanged.connect(self._on_poco_address_changed)
 
+        # Each bus has its own device cache
+        self.interface_combo.currentTextChanged.connect(self._on_bus_changed)
+        self.channel_combo.currentTextChanged.connect(self._on_bus_changed)
+
         # Auto-connect if enabled
         if self.auto_reconnect:
             QTimer.singleShot(1000, self._connect_can)  # Connect after 1 second
 
     def _save_settings(self):
-        """Save current CAN interface settings."""
+        """Save current CAN interface settings once edits have settled (see _do_save_settings)."""
+        self._save_timer.start()
+
+    def _do_save_settings(self):
+        """Write current CAN interface settings to QSettings."""
+        self._save_timer.stop()
         self.settings.setValue("interface", self.interface_combo.currentText())
         self.settings.setValue("channel", self.channel_combo.currentText())
         self.settings.setValue("source_address", self.source_addr_combo.currentText())
         self.settings.setValue("poco_address", self.poco_addr_combo.currentText())
         self.settings.setValue("auto_reconnect", self.auto_reconnect_cb.isChecked())
 
+    @staticmethod
+    def _device_item_text(addr, device_id):
+        """Dropdown text for a device: address in hex and the last 4 hex digits of its ID"""
+        return f"0x{addr:02X} - 0x{device_id & 0xFFFF:04X}"
+
+    def _device_cache_key(self):
+        """QSettings key of the device cache for the selected interface and channel"""
+        return f"poco_devices/{self.interface_combo.currentText()}:{self.channel_combo.currentText()}"
+
+    def _save_device_cache(self, sorted_devices):
+        """Store discovered (addr, device_info) pairs as JSON [addr, device_id] pairs for this bus."""
+        self.settings.setValue(self._device_cache_key(),
+                               json.dumps([[addr, info['device_id']] for addr, info in sorted_devices]))
+
+    def _load_device_cache(self, reset_if_missing=False):
+        """
+        Fill the address dropdown with the devices last discovered on the selected bus.
+        The entries are shown greyed out until a device confirms them.
+
+        Args:
+            reset_if_missing: Reduce the dropdown to broadcast only when the bus has
+                no cached devices, dropping devices listed for a previous bus
+        """
+        try:
+            cached = [(int(addr), int(device_id))
+                      for addr, device_id in json.loads(self.settings.value(self._device_cache_key(), "") or "[]")]
+        except (TypeError, ValueError):
+            logger.warning("Ignoring malformed Poco device cache")
+            cached = []
+        if not cached:
+            if reset_if_missing:
+                self._reset_poco_addresses()
+            return
+
+        current_text = self.poco_addr_combo.currentText()
+        self.poco_addr_combo.blockSignals(True)
+        try:
+            self.poco_addr_combo.clear()
+            self.poco_addr_combo.addItems(["0xFF (Broadcast)"] +
+                                          [self._device_item_text(addr, device_id)
+                                           for addr, device_id in cached])
+            self.poco_addr_combo.setItemData(0, 0xFF, Qt.UserRole)
+            for index, (addr, _) in enumerate(cached, start=1):
+                self.poco_addr_combo.setItemData(index, addr, Qt.UserRole)
+                self.poco_addr_combo.setItemData(index, self.TENTATIVE_DEVICE_COLOR, Qt.ForegroundRole)
+                self.poco_addr_combo.setItemData(index, "Cached, not yet seen since start-up", Qt.ToolTipRole)
+            self.poco_addr_combo.setCurrentText(current_text)
+        finally:
+            self.poco_addr_combo.blockSignals(False)
+        self._tentative_addrs = {addr for addr, _ in cached}
+        self._refresh_poco_addr_cache()
+
+    def _reset_poco_addresses(self):
+        """Reduce the address dropdown to the broadcast entry."""
+        current_text = self.poco_addr_combo.currentText()
+        self.poco_addr_combo.blockSignals(True)
+        try:
+            self.poco_addr_combo.clear()
+            self.poco_addr_combo.addItem("0xFF (Broadcast)", 0xFF)
+            self.poco_addr_combo.setCurrentIndex(0)
+        finally:
+            self.poco_addr_combo.blockSignals(False)
+        self._tentative_addrs = set()
+        self._refresh_poco_addr_cache()
+
+        new_text = self.poco_addr_combo.currentText()
+        if new_text != current_text:
+            self._on_poco_address_changed(new_text)
+            self._save_settings()
+
+    def _on_bus_changed(self, text):
+        """Reload the device cache once the interface/channel text has settled."""
+        self._bus_change_timer.start()
+
+    def _reload_device_cache(self):
+        """Offer the devices cached for the newly selected interface and channel."""
+        self._load_device_cache(reset_if_missing=True)
+
+    def _promote_cached_device(self, can_address):
+        """Show a cached dropdown entry as confirmed once its device has responded."""
+        if can_address not in self._tentative_addrs:
+            return
+        self._tentative_addrs.discard(can_address)
+        index = self.poco_addr_combo.findData(can_address, Qt.UserRole)
+        if index >= 0:
+            self.poco_addr_combo.setItemData(index, None, Qt.ForegroundRole)
+            self.poco_addr_combo.setItemData(index, None, Qt.ToolTipRole)
+
     def _on_poco_address_changed(self, text):
         """Update the poco_address in the interface when dropdown changes."""
         if self.poco:
@@ -586,39 +801,55 @@ class CANConnectionWidget(QFrame):
                 logging.info(f"Updated target Poco address to: {new_addr}")
 
                 # Do a single poll to check if the new device responds
-                self._poll_poco_device()
+                self._poll_limiter.queue_command(self._poll_poco_device)
 
             except ValueError as e:
                 logging.warning(f"Failed to parse Poco address: {e}")
 
     def _enumerate_can_interfaces(self):
-        """Enumerate available CAN interfaces on the system."""
+        """
+        Enumerate available CAN interfaces on the system.
+        The result is cached until the user clicks Refresh.
+        """
+        if self._cached_interfaces is not None:
+            return self._cached_interfaces
+
         interfaces = []
         try:
-            net_dir = "/sys/class/net"
-            if os.path.exists(net_dir):
-                for iface in os.listdir(net_dir):
-                    if iface.startswith(('can', 'vcan')):
-                        interfaces.append(iface)
+            with os.scandir("/sys/class/net") as entries:
+                interfaces = [entry.name for entry in entries if entry.name.startswith(('can', 'vcan'))]
         except Exception:
             pass
-        return interfaces if interfaces else ["can0", "vcan0"]
+        self._cached_interfaces = interfaces if interfaces else ["can0", "vcan0"]
+        return self._cached_interfaces
 
     def _refresh_interfaces(self):
         """Refresh the list of available CAN interfaces."""
         current_selection = self.channel_combo.currentText()
-        self.channel_combo.clear()
 
-        available_interfaces = self._enumerate_can_interfaces()
-        self.channel_combo.addItems(available_interfaces)
+        # The selection is restored below, so the intermediate texts from
+        # clear()/addItems() must not reach _save_settings
+        self.channel_combo.blockSignals(True)
+        try:
+            self.channel_combo.clear()
+
+            self._cached_interfaces = None
+            available_interfaces = self._enumerate_can_interfaces()
+            self.channel_combo.addItems(available_interfaces)
+
+            # Try to restore previous selection
+            if current_selection:
+                index = self.channel_combo.findText(current_selection)
+                if index >= 0:
+                    self.channel_combo.setCurrentIndex(index)
+                else:
+                    self.channel_combo.setCurrentText(current_selection)
+        finally:
+            self.channel_combo.blockSignals(False)
 
-        # Try to restore previous selection
-        if current_selection:
-            index = self.channel_combo.findText(current_selection)
-            if index >= 0:
-                self.channel_combo.setCurrentIndex(index)
-            else:
-                self.channel_combo.setCurrentText(current_selection)
+        # Only an empty previous selection can leave a different text behind
+        if self.channel_combo.currentText() != current_selection:
+            self._save_settings()
 
     def _parse_poco_address(self, text):
         """
@@ -633,28 +864,43 @@ class CANConnectionWidget(QFrame):
         Returns:
             int: The parsed address (0-255)
         """
-        import re
+        address = self._addr_parse_cache.get(text)
+        if address is None:
+            address = self._parse_poco_address_text(text)
+            # The combo is editable; don't let typed-in texts grow the cache forever
+            if len(self._addr_parse_cache) >= self.ADDR_PARSE_CACHE_SIZE:
+                self._addr_parse_cache.clear()
+            self._addr_parse_cache[text] = address
+        return address
+
+    @staticmethod
+    def _parse_poco_address_text(text):
+        """Parse a Poco address without caching (see _parse_poco_address)"""
         text = text.strip()
 
         # Try to match hex format first (0xNN)
-        hex_match = re.match(r'0x([0-9A-Fa-f]+)', text)
+        hex_match = _POCO_HEX_RE.match(text)
         if hex_match:
             return int(hex_match.group(1), 16)
 
         # Fall back to decimal format
-        dec_match = re.match(r'(\d+)', text)
+        dec_match = _POCO_DEC_RE.match(text)
         if dec_match:
-            return int(dec_match.group(1))
+            return int(dec_match.group())
 
         raise ValueError(f"Cannot parse address from: {text}")
 
     def _connect_can(self):
         """Connect to CAN bus."""
+        # Imported here so that importing this module does not load python-can
+        from poco_can.poco_can_interface import PocoCANInterfaceBase
+
         try:
             # Clean up any existing connection first
             if self.poco:
+                self._remove_enumerate_callback()
                 self.poco.disconnect()
-                self.poco = None
+                self._set_poco(None)
 
             interface = self.interface_combo.currentText()
             channel = self.channel_combo.currentText()
@@ -676,17 +922,18 @@ class CANConnectionWidget(QFrame):
                 raise Exception(f"Invalid Poco address: {e}")
 
             # Create base interface - applications can wrap this with their chosen protocol level
-            self.poco = PocoCANInterfaceBase(
+            self._set_poco(PocoCANInterfaceBase(
                 interface=interface,
                 channel=channel,
                 source_address=source_addr,
                 poco_address=poco_addr
-            )
+            ))
             self.poco.connect()
             self.poco.start_listener()  # Start listening for enumeration responses
 
             # Register callback to handle enumerate responses for connection status
             self.poco.add_enumeration_callback(self._on_enumerate_callback)
+            self._enum_cb_registered = True
 
             # Update UI state for connected CAN bus
             self._set_can_connected_state()
@@ -708,15 +955,17 @@ class CANConnectionWidget(QFrame):
         """Disconnect from CAN bus."""
         # Emit disconnected signal BEFORE closing the bus so listeners can clean up their notifiers
         self.disconnected.emit()
+        self._discovery_cache = None
+
+        # Optionally forget this bus's devices, e.g. for setups that are rewired often
+        if self.settings.value("clear_device_cache_on_disconnect", False, type=bool):
+            self.settings.remove(self._device_cache_key())
 
         if self.poco:
             # Remove our callback before disconnecting
-            try:
-                self.poco.remove_enumeration_callback(self._on_enumerate_callback)
-            except:
-                pass  # Ignore errors if callback wasn't registered
+            self._remove_enumerate_callback()
             self.poco.disconnect()
-            self.poco = None
+            self._set_poco(None)
 
         # Update UI state for disconnected CAN bus
         self._set_can_disconnected_state()
@@ -736,7 +985,7 @@ class CANConnectionWidget(QFrame):
             self._connect_can()
 
         # Save the setting immediately
-        self._save_settings()
+        self._do_save_settings()
 
     def _attempt_reconnect(self):
         """Attempt to reconnect automatically"""
@@ -788,44 +1037,61 @@ class CANConnectionWidget(QFrame):
                               "Please connect to the CAN bus before discovering devices.")
             return
 
-        # Show discovery dialog
+        # Show discovery dialog, with the previous result if it is recent enough
         dialog = DeviceDiscoveryDialog(self.poco, self)
-        if dialog.exec_() == QDialog.Accepted:
+        cache_key = (self.interface_combo.currentText(), self.channel_combo.currentText(),
+                     self.get_source_address())
+        if self._discovery_cache is not None:
+            key, found_at, devices = self._discovery_cache
+            if key == cache_key and time.monotonic() - found_at < self.DISCOVERY_CACHE_TTL_S:
+                dialog.preload(devices)
+
+        result = dialog.exec_()
+        sorted_devices = dialog.get_devices_sorted()
+        devices = dict(sorted_devices)
+        if dialog.scanned:
+            self._discovery_cache = (cache_key, time.monotonic(), devices) if devices else None
+
+        if result == QDialog.Accepted:
             # User selected a device - update the dropdown with all discovered devices
-            devices = self.poco.get_discovered_devices()
             if devices:
                 # Remember current selection
                 current_text = self.poco_addr_combo.currentText()
 
-                # Clear and repopulate dropdown
-                self.poco_addr_combo.clear()
-
-                # Always add broadcast first
-                self.poco_addr_combo.addItem("0xFF (Broadcast)")
-
-                # Add discovered devices with formatted text (address in hex and device ID suffix)
-                for addr in sorted(devices.keys()):
-                    device_info = devices[addr]
-                    device_id_suffix = device_info['device_id'] & 0xFFFF  # Last 4 hex digits (16 bits)
-                    item_text = f"0x{addr:02X} - 0x{device_id_suffix:04X}"
-                    self.poco_addr_combo.addItem(item_text)
-
-                # If user selected a specific device, set it
-                selected_addr = dialog.get_selected_address()
-                if selected_addr is not None:
-                    # Find and select the item with this address
-                    for i in range(self.poco_addr_combo.count()):
-                        if self.poco_addr_combo.itemText(i).startswith(f"0x{selected_addr:02X} "):
-                            self.poco_addr_combo.setCurrentIndex(i)
-                            break
-                else:
-                    # Try to restore previous selection
-                    index = self.poco_addr_combo.findText(current_text)
-                    if index >= 0:
-                        self.poco_addr_combo.setCurrentIndex(index)
-                    else:
-                        self.poco_addr_combo.setCurrentIndex(0)  # Default to broadcast
-
+                # Broadcast first, then the discovered devices by address
+                items = ["0xFF (Broadcast)"] + [self._device_item_text(addr, info['device_id'])
+                                                for addr, info in sorted_devices]
+                addr_to_index = {addr: index for index, (addr, _) in enumerate(sorted_devices, start=1)}
+
+                # Repopulate without a currentTextChanged (settings write, device
+                # poll) for every intermediate item; handled once below instead
+                self.poco_addr_combo.blockSignals(True)
+                try:
+                    self.poco_addr_combo.clear()
+                    self.poco_addr_combo.addItems(items)
+                    self.poco_addr_combo.setItemData(0, 0xFF, Qt.UserRole)
+                    for addr, index in addr_to_index.items():
+                        self.poco_addr_combo.setItemData(index, addr, Qt.UserRole)
+
+                    # If user selected a specific device, set it
+                    selected_addr = dialog.get_selected_address()
+                    if selected_addr in addr_to_index:
+                        self.poco_addr_combo.setCurrentIndex(addr_to_index[selected_addr])
+                    elif selected_addr is None:
+                        # Try to restore previous selection
+                        index = self.poco_addr_combo.findText(current_text)
+                        self.poco_addr_combo.setCurrentIndex(max(index, 0))  # Default to broadcast
+                finally:
+                    self.poco_addr_combo.blockSignals(False)
+                self._refresh_poco_addr_cache()
+
+                # Every entry now comes from this discovery
+                self._tentative_addrs.clear()
+                self._save_device_cache(sorted_devices)
+
+                new_text = self.poco_addr_combo.currentText()
+                if new_text != current_text:
+                    self._on_poco_address_changed(new_text)
                 self._save_settings()
 
     def get_poco_interface(self):
@@ -843,7 +1109,12 @@ class CANConnectionWidget(QFrame):
         Args:
             poco_interface: The new interface instance to use
         """
+        self._set_poco(poco_interface)
+
+    def _set_poco(self, poco_interface):
+        """Set self.poco together with the method references bound from it."""
         self.poco = poco_interface
+        self._send_enumerate = poco_interface.send_enumerate_request if poco_interface else None
 
     def is_connected(self):
         """Check if currently connected to CAN bus."""
@@ -851,20 +1122,46 @@ class CANConnectionWidget(QFrame):
 
     def get_source_address(self):
         """Get the configured source address."""
-        try:
-            return int(self.source_addr_combo.currentText())
-        except ValueError:
-            return 0
+        return self._source_addr_cached
 
     def get_poco_address(self):
         """Get the configured Poco target address."""
+        return self._poco_addr_cached
+
+    def _refresh_source_addr_cache(self, text=None):
+        """Re-parse the source address after the combo text changed."""
+        try:
+            self._source_addr_cached = int(self.source_addr_combo.currentText())
+        except ValueError:
+            self._source_addr_cached = 0
+
+    def _refresh_poco_addr_cache(self, text=None):
+        """Re-parse the Poco target address after the combo text changed."""
+        # Dropdown entries carry their address; only typed-in text needs parsing
+        combo = self.poco_addr_combo
+        text = combo.currentText()
+        index = combo.currentIndex()
+        if index >= 0 and combo.itemText(index) == text:
+            address = combo.itemData(index, Qt.UserRole)
+            if address is not None:
+                self._poco_addr_cached = address
+                return
         try:
-            return self._parse_poco_address(self.poco_addr_combo.currentText())
+            self._poco_addr_cached = self._parse_poco_address(text)
         except ValueError:
-            return 255
+            self._poco_addr_cached = 255
+
+    def _remove_enumerate_callback(self):
+        """Unregister _on_enumerate_callback from the interface if it is registered."""
+        if self._enum_cb_registered:
+            self.poco.remove_enumeration_callback(self._on_enumerate_callback)
+            self._enum_cb_registered = False
 
     def _on_enumerate_callback(self, can_address: int, device_info: dict):
         """Callback for handling enumerate responses from Poco devices."""
+        if can_address in self._tentative_addrs:
+            self._device_confirmed.emit(can_address)
+
         target_addr = self.get_poco_address()
 
         # If we're targeting this specific device or in broadcast mode
@@ -904,7 +1201,8 @@ class CANConnectionWidget(QFrame):
 
     def _poll_poco_device(self):
         """Send an enumerate request to check if the target device is still responsive."""
-        if not self.poco:
+        send_enumerate = self._send_enumerate
+        if send_enumerate is None:
             return
 
         try:
@@ -914,7 +1212,7 @@ class CANConnectionWidget(QFrame):
             self.last_poll_time = time.time()
 
             # Send enumerate request using the interface's built-in method
-            self.poco.send_enumerate_request(priority=6)
+            send_enumerate(priority=6)
 
             # For broadcast address, we consider the poll successful if we can send
             if target_addr == 0xFF:
@@ -930,30 +1228,37 @@ class CANConnectionWidget(QFrame):
 
     def _update_connection_status(self, connected: bool, color: str):
         """Update the visual connection status indicator."""
-        self.connection_active = connected
-
         if color == "green":
-            self.connection_status.setProperty("status", "connected")
-            self.connection_status.setToolTip("Connected to Poco device")
+            status = "connected"
         elif color == "red":
-            self.connection_status.setProperty("status", "disconnected")
-            self.connection_status.setToolTip("Poco device not responding")
+            status = "disconnected"
         else:  # gray
-            self.connection_status.setProperty("status", "unknown")
-            self.connection_status.setToolTip("Connection status unknown")
+            status = "unknown"
+
+        # Repeated poll results leave the indicator as it is; restyling it re-runs the QSS cascade
+        if status == self.connection_status.property("status") and connected == self.connection_active:
+            return
+        self.connection_active = connected
 
-        # Force style refresh
-        self.connection_status.style().unpolish(self.connection_status)
+        self.connection_status.setProperty("status", status)
         self.connection_status.style().polish(self.connection_status)
+        if status == "connected":
+            self.connection_status.setToolTip("Connected to Poco device")
+        elif status == "disconnected":
+            self.connection_status.setToolTip("Poco device not responding")
+        else:
+            self.connection_status.setToolTip("Connection status unknown")
 
     def cleanup(self):
         """Clean up resources - should be called before widget destruction"""
+        if self._save_timer.isActive():
+            self._do_save_settings()
         self._stop_device_polling()
         if self.reconnect_timer.isActive():
             self.reconnect_timer.stop()
         if self.poco:
             self.poco.disconnect()
-            self.poco = None
+            self._set_poco(None)
 
 
 # Common dark theme stylesheet
@@ -1016,20 +1321,6 @@ DARK_THEME_STYLESHEET = """
         font-family: monospace;
     }
 
-    /* Connection Status Indicator */
-    QLabel[objectName="connectionStatus"] {
-        font-size: 16px;
-    }
-    QLabel[objectName="connectionStatus"][status="connected"] {
-        color: #00ff00;
-    }
-    QLabel[objectName="connectionStatus"][status="disconnected"] {
-        color: #ff0000;
-    }
-    QLabel[objectName="connectionStatus"][status="unknown"] {
-        color: #808080;
-    }
-
     /* Section Group Frames */
     QFrame[objectName="sectionGroup"] {
         background-color: #2a2a2a;
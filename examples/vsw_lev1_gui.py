@@ -15,15 +15,35 @@ Run with:
 """
 
 import sys
-from PyQt5.QtCore import Qt, pyqtSignal, QSettings
+from PyQt5.QtCore import Qt, pyqtSignal, QSettings, QRect, QEvent, QTimer
 from PyQt5.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout,
                              QHBoxLayout, QGridLayout, QLabel, QPushButton,
-                             QFrame, QSpinBox, QGroupBox)
-from PyQt5.QtGui import QPainter, QPen, QBrush, QColor, QFont
+                             QFrame, QSpinBox, QGroupBox, QToolTip)
+from PyQt5.QtGui import QPainter, QPen, QBrush, QColor, QFont, QPixmap
 
 from examples.poco_gui_common import CANConnectionWidget, DARK_THEME_STYLESHEET, create_title_label, create_status_label
 from poco_can.poco_can_interface import PocoCANInterfaceLevel1
 
+# Dark theme with better disabled state visibility, built once at import
+_ENHANCED_DARK_QSS = DARK_THEME_STYLESHEET + """
+    QPushButton:disabled {
+        background-color: #2a2a2a;
+        color: #555555;
+        border: 1px solid #3a3a3a;
+    }
+    QSpinBox:disabled {
+        background-color: #2a2a2a;
+        color: #555555;
+        border: 1px solid #3a3a3a;
+    }
+    QGroupBox:disabled {
+        color: #555555;
+    }
+"""
+
+# PGN 127502 switch states for a whole bank with every switch set to "No Change"
+_NO_CHANGE_STATES = bytes([3]) * 28
+
 
 class BinaryLEDIndicator(QWidget):
     """
@@ -39,27 +59,62 @@ class BinaryLEDIndicator(QWidget):
 
     clicked = pyqtSignal(int, int)  # Emits (switch_id, new_state) when clicked
 
+    # Tooltip text per state
+    _STATE_NAMES = {OFF: "OFF", ON: "ON", NA: "N/A"}
+
+    # Widget width and height
+    SIZE = 30
+
+    # (brush, pen) per state plus 'disabled', shared by all LEDs; see _ensure_palette
+    _PALETTE = None
+    _HIGHLIGHT = None
+
+    # Rendered LED per (state, enabled, device pixel ratio), see _pixmap
+    _PIXMAPS = {}
+
+    @classmethod
+    def _ensure_palette(cls):
+        """Create the shared LED brushes and pens on first use"""
+        if cls._PALETTE is not None:
+            return
+
+        def entry(led_color, border_color):
+            return QBrush(led_color), QPen(border_color, 1)
+
+        cls._PALETTE = {
+            cls.OFF: entry(QColor(200, 60, 60), QColor(150, 40, 40)),  # Red
+            cls.ON: entry(QColor(60, 200, 60), QColor(40, 150, 40)),  # Green
+            cls.NA: entry(QColor(100, 100, 100), QColor(70, 70, 70)),  # Gray
+            'disabled': entry(QColor(60, 60, 60), QColor(40, 40, 40)),  # Very dark gray
+        }
+        cls._HIGHLIGHT = QBrush(QColor(255, 255, 255, 100))
+
     def __init__(self, switch_id=0):
         super().__init__()
+        self._ensure_palette()
         self.switch_id = switch_id
         self.state = 3  # 0=Off, 1=On, 3=N/A
-        self.setFixedSize(30, 30)
+        self.setFixedSize(self.SIZE, self.SIZE)
         self.setCursor(Qt.PointingHandCursor)
-        self.setToolTip(f"Binary Switch {self.switch_id + 1}: N/A\nClick to toggle")
 
     def set_state(self, state):
         """Set LED state: 0=Off, 1=On, 3=N/A"""
+        if state == self.state:
+            return
         self.state = state
+        self.update()
 
-        if state == 0:
-            status = "OFF"
-        elif state == 1:
-            status = "ON"
-        else:
-            status = "N/A"
+    def event(self, event):
+        """Build the tooltip only when it is about to be shown"""
+        if event.type() == QEvent.ToolTip:
+            QToolTip.showText(event.globalPos(), self._format_tooltip(), self)
+            return True
+        return super().event(event)
 
-        self.setToolTip(f"Binary Switch {self.switch_id + 1}: {status}\nClick to toggle")
-        self.update()
+    def _format_tooltip(self):
+        """Tooltip text for the current state"""
+        status = self._STATE_NAMES.get(self.state, "N/A")
+        return f"Binary Switch {self.switch_id + 1}: {status}\nClick to toggle"
 
     def mousePressEvent(self, event):
         """Handle mouse clicks to toggle switch state"""
@@ -68,44 +123,51 @@ class BinaryLEDIndicator(QWidget):
                 new_state = self.ON if self.state == self.OFF else self.OFF
                 self.clicked.emit(self.switch_id, new_state)
 
-    def paintEvent(self, event):
-        painter = QPainter(self)
+    @classmethod
+    def _pixmap(cls, state, enabled, ratio):
+        """Return the LED image for a state, rendered once per (state, enabled, ratio)"""
+        key = (state if state in (cls.OFF, cls.ON) else cls.NA, enabled, ratio)
+        pixmap = cls._PIXMAPS.get(key)
+        if pixmap is None:
+            pixmap = cls._PIXMAPS[key] = cls._render(*key)
+        return pixmap
+
+    @classmethod
+    def _render(cls, state, enabled, ratio):
+        """Draw the LED for a state into a pixmap of the widget size at a device pixel ratio"""
+        pixmap = QPixmap(int(cls.SIZE * ratio), int(cls.SIZE * ratio))
+        pixmap.setDevicePixelRatio(ratio)
+        pixmap.fill(Qt.transparent)
+
+        painter = QPainter(pixmap)
         painter.setRenderHint(QPainter.Antialiasing)
 
-        rect = self.rect()
-        center = rect.center()
-        radius = min(rect.width(), rect.height()) // 2 - 2
+        center = QRect(0, 0, cls.SIZE, cls.SIZE).center()
+        radius = cls.SIZE // 2 - 2
 
         # If widget is disabled, draw with very low opacity
-        if not self.isEnabled():
-            led_color = QColor(60, 60, 60)  # Very dark gray
-            border_color = QColor(40, 40, 40)
-        # Choose color based on state
-        elif self.state == 0:  # Off
-            led_color = QColor(200, 60, 60)  # Red
-            border_color = QColor(150, 40, 40)
-        elif self.state == 1:  # On
-            led_color = QColor(60, 200, 60)  # Green
-            border_color = QColor(40, 150, 40)
-        else:  # N/A
-            led_color = QColor(100, 100, 100)  # Gray
-            border_color = QColor(70, 70, 70)
+        brush, pen = cls._PALETTE[state if enabled else 'disabled']
 
         # Draw LED
-        painter.setPen(QPen(border_color, 1))
-        painter.setBrush(QBrush(led_color))
+        painter.setPen(pen)
+        painter.setBrush(brush)
         painter.drawEllipse(center.x() - radius, center.y() - radius, radius * 2, radius * 2)
 
         # Add highlight for 3D effect (only when enabled and not N/A)
-        if self.isEnabled() and self.state != 3:
-            highlight = QColor(255, 255, 255, 100)
+        if enabled and state != cls.NA:
             painter.setPen(Qt.NoPen)
-            painter.setBrush(QBrush(highlight))
+            painter.setBrush(cls._HIGHLIGHT)
             highlight_radius = radius // 3
             highlight_x = center.x() - radius // 2
             highlight_y = center.y() - radius // 2
             painter.drawEllipse(highlight_x, highlight_y, highlight_radius, highlight_radius)
 
+        painter.end()
+        return pixmap
+
+    def paintEvent(self, event):
+        QPainter(self).drawPixmap(0, 0, self._pixmap(self.state, self.isEnabled(), self.devicePixelRatioF()))
+
 
 class BinarySwitchesGUI(QMainWindow):
     """GUI for binary switch control and monitoring."""
@@ -119,26 +181,20 @@ class BinarySwitchesGUI(QMainWindow):
         self.current_bank = 0  # Default to bank 0
         self.settings = QSettings("Lumitec", "PocoBinarySwitches")
 
+        # Reused switch states buffer for control messages, see _no_change_states()
+        self._switch_states = bytearray(_NO_CHANGE_STATES)
+
+        # Last status frame shown on the LEDs, None once a control message changed them
+        self._shown_states = None
+
+        # Latest (bank, switch_states) not yet shown, see _flush_binary_indicators
+        self._pending_switch_states = None
+        self._led_flush_scheduled = False
+
         self.setWindowTitle("Poco Binary Switches")
         self.setGeometry(100, 100, 700, 600)
 
-        # Enhanced stylesheet with better disabled state visibility
-        enhanced_stylesheet = DARK_THEME_STYLESHEET + """
-            QPushButton:disabled {
-                background-color: #2a2a2a;
-                color: #555555;
-                border: 1px solid #3a3a3a;
-            }
-            QSpinBox:disabled {
-                background-color: #2a2a2a;
-                color: #555555;
-                border: 1px solid #3a3a3a;
-            }
-            QGroupBox:disabled {
-                color: #555555;
-            }
-        """
-        self.setStyleSheet(enhanced_stylesheet)
+        self.setStyleSheet(_ENHANCED_DARK_QSS)
 
         # Connect signal for thread-safe GUI updates
         self.device_state_signal.connect(self._update_binary_indicators_safe)
@@ -350,19 +406,46 @@ class BinarySwitchesGUI(QMainWindow):
         if bank != self.current_bank:
             return  # Ignore updates for other banks
 
-        for i in range(min(len(self.binary_leds), len(switch_states))):
-            state = switch_states[i]
-            if state == 0:
-                self.binary_leds[i].set_state(BinaryLEDIndicator.OFF)
-            elif state == 1:
-                self.binary_leds[i].set_state(BinaryLEDIndicator.ON)
-            else:
-                self.binary_leds[i].set_state(BinaryLEDIndicator.NA)
-
-        on_count = sum(1 for state in switch_states if state == 1)
-        off_count = sum(1 for state in switch_states if state == 0)
+        # Frames arriving in a burst are shown once, from the latest frame
+        self._pending_switch_states = (bank, switch_states)
+        if not self._led_flush_scheduled:
+            self._led_flush_scheduled = True
+            QTimer.singleShot(0, self._flush_binary_indicators)
+
+    def _flush_binary_indicators(self):
+        """Show the most recent binary switch status frame"""
+        self._led_flush_scheduled = False
+        if self._pending_switch_states is None:
+            return
+        bank, switch_states = self._pending_switch_states
+        self._pending_switch_states = None
+        if bank != self.current_bank:
+            return  # Bank changed since the frame arrived
+
+        # Status frames mostly repeat the current states: a repeated frame is
+        # caught by one bytes compare, otherwise only changed LEDs are repainted
+        states = bytes(switch_states)
+        if states != self._shown_states:
+            self._shown_states = states
+            self._apply_binary_states(states)
+
+        on_count = states.count(BinaryLEDIndicator.ON)
+        off_count = states.count(BinaryLEDIndicator.OFF)
         self.status_label.setText(f"Bank {bank}: {on_count} ON, {off_count} OFF")
 
+    def _apply_binary_states(self, switch_states):
+        """Show received switch states on the LED indicators"""
+        for led, state in zip(self.binary_leds, switch_states):
+            if state != BinaryLEDIndicator.OFF and state != BinaryLEDIndicator.ON:
+                state = BinaryLEDIndicator.NA
+            if led.state != state:
+                led.set_state(state)
+
+    def _no_change_states(self):
+        """Reset the shared switch states buffer to "No Change" and return it"""
+        self._switch_states[:] = _NO_CHANGE_STATES
+        return self._switch_states
+
     def _on_binary_led_clicked(self, switch_id, new_state):
         """Handle binary LED indicator clicks"""
         if not hasattr(self, 'poco_level1') or not self.poco_level1:
@@ -371,11 +454,12 @@ class BinarySwitchesGUI(QMainWindow):
 
         try:
             # Build switch states array - set clicked switch, rest to "No Change"
-            switch_states = [3] * 28
+            switch_states = self._no_change_states()
             switch_states[switch_id] = new_state
 
             self.poco_level1.send_binary_switch_control(self.current_bank, switch_states)
             self.binary_leds[switch_id].set_state(new_state)
+            self._shown_states = None
 
             state_name = "ON" if new_state == 1 else "OFF"
             self.status_label.setText(f"Switch {switch_id + 1}: Set to {state_name}")
@@ -389,11 +473,12 @@ class BinarySwitchesGUI(QMainWindow):
             return
 
         try:
-            switch_states = [state] * 28
+            switch_states = bytes([state]) * 28
             self.poco_level1.send_binary_switch_control(self.current_bank, switch_states)
 
             for led in self.binary_leds:
                 led.set_state(state)
+            self._shown_states = None
 
             state_name = "ON" if state == 1 else "OFF"
             self.status_label.setText(f"All switches set to {state_name}")
@@ -410,16 +495,17 @@ class BinarySwitchesGUI(QMainWindow):
             start = self.range_start_spin.value() - 1  # Convert to 0-based
             end = self.range_end_spin.value()  # Inclusive range
 
-            switch_states = [3] * 28  # All "No Change"
-            for i in range(start, end):
-                if i < 28:
-                    switch_states[i] = state
+            # Switches start..end-1 get the new state, the rest "No Change"
+            switch_states = self._no_change_states()
+            end = min(end, len(switch_states))
+            count = max(end - start, 0)
+            switch_states[start:end] = bytes([state]) * count
 
             self.poco_level1.send_binary_switch_control(self.current_bank, switch_states)
 
-            for i in range(start, end):
-                if i < len(self.binary_leds):
-                    self.binary_leds[i].set_state(state)
+            for led in self.binary_leds[start:end]:
+                led.set_state(state)
+            self._shown_states = None
 
             state_name = "ON" if state == 1 else "OFF"
             self.status_label.setText(f"Switches {start+1}-{end} set to {state_name}")
@@ -18,6 +18,7 @@ import math
 import time
 import os
 import colorsys
+from functools import lru_cache
 from PyQt5.QtCore import Qt, QTimer, QPoint, QRect, pyqtSignal
 from PyQt5.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout,
                              QHBoxLayout, QGridLayout, QLabel, QPushButton,
@@ -38,6 +39,22 @@ POCOFX_DATA = [
     {'name': 'Wind Gusts', 'FxId': 133}
 ]
 
+
+@lru_cache(maxsize=4096)
+def _hsb_to_rgb255(hue, saturation, brightness):
+    """Convert H=0-360, S=0-100, B=0-100 to 0-255 (red, green, blue)"""
+    # colorsys uses H=0-1, S=0-1, V=0-1
+    r, g, b = colorsys.hsv_to_rgb(hue / 360.0, saturation / 100.0, brightness / 100.0)
+    return int(round(r * 255)), int(round(g * 255)), int(round(b * 255))
+
+
+@lru_cache(maxsize=4096)
+def _rgb255_to_hsb(red, green, blue):
+    """Convert 0-255 red, green, blue to H=0-360, S=0-100, B=0-100"""
+    h_norm, s_norm, v_norm = colorsys.rgb_to_hsv(red / 255.0, green / 255.0, blue / 255.0)
+    return h_norm * 360, s_norm * 100, v_norm * 100
+
+
 class CircularSwitch(QWidget):
     """
     Custom circular switch widget that mimics the Poco app interface.
@@ -46,6 +63,21 @@ class CircularSwitch(QWidget):
     clicked = pyqtSignal()
     long_pressed = pyqtSignal()
 
+    # Width of the brightness ring in pixels
+    RING_THICKNESS = 8
+
+    # Full-brightness ring/icon colors: Qt saturation (0-255) -> list indexed by hue
+    _HUE_LUT_CACHE = {}
+
+    @classmethod
+    def _get_vibrant(cls, hue, saturation):
+        """Return the full-brightness QColor for hue (0-359) and saturation (0-100)"""
+        sat255 = int(saturation * 2.55)
+        lut = cls._HUE_LUT_CACHE.get(sat255)
+        if lut is None:
+            lut = cls._HUE_LUT_CACHE[sat255] = [QColor.fromHsv(h, sat255, 255) for h in range(360)]
+        return lut[hue]
+
     def __init__(self, switch_id=0, label="Switch"):
         super().__init__()
         self.switch_id = switch_id
@@ -55,6 +87,7 @@ class CircularSwitch(QWidget):
         self.saturation = 0   # Zero saturation = white light
         self.brightness = 100   # Full brightness for default white
         self.is_synced = True  # Whether GUI state matches device state
+        self._vibrant_color = self._get_vibrant(self.hue, self.saturation)
 
         # Long press detection
         self.press_timer = QTimer()
@@ -69,6 +102,9 @@ class CircularSwitch(QWidget):
         self.setMinimumSize(120, 140)  # Width, Height (extra for label)
         self.setMaximumSize(150, 170)
 
+        # Paint geometry, recomputed by _update_geometry() when the size changes
+        self._geom_dirty = True
+
         # Initialize tooltip
         self._update_tooltip()
 
@@ -88,6 +124,7 @@ class CircularSwitch(QWidget):
 
     def set_state(self, on_state, synced=True):
         """Set the switch on/off state"""
+        only_sync_changed = on_state == self.is_on
         self.is_on = on_state
         self.is_synced = synced
         if not synced:
@@ -96,18 +133,29 @@ class CircularSwitch(QWidget):
         else:
             self.sync_timer.stop()
         self._update_tooltip()
-        self.update()
+        if only_sync_changed:
+            self._update_sync_dot()
+        else:
+            self.update()
 
     def _sync_timeout(self):
         """Called when no device response received - assume command worked"""
         self.is_synced = True
-        self.update()
+        self._update_sync_dot()
+
+    def _update_sync_dot(self):
+        """Repaint only the sync status dot"""
+        if self._geom_dirty:
+            self.update()
+        else:
+            self.update(self._sync_dirty_rect)
 
     def set_color(self, hue, saturation=100, brightness=100, synced=True):
         """Set the ring color using HSV values"""
         self.hue = int(hue) % 360
         self.saturation = max(0, min(100, saturation))
         self.brightness = max(0, min(100, brightness))
+        self._vibrant_color = self._get_vibrant(self.hue, self.saturation)
         self.is_synced = synced
         self._update_tooltip()
         self.update()
@@ -122,10 +170,12 @@ class CircularSwitch(QWidget):
                 self.press_timer.stop()
                 self.clicked.emit()  # Short click
 
-    def paintEvent(self, event):
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.Antialiasing)
+    def resizeEvent(self, event):
+        self._geom_dirty = True
+        super().resizeEvent(event)
 
+    def _update_geometry(self):
+        """Compute the rectangles and points used by paintEvent for the current size"""
         rect = self.rect()
 
         # Calculate available space for switch (leave room for label)
@@ -135,28 +185,114 @@ class CircularSwitch(QWidget):
         switch_radius = switch_size // 2
 
         # Center the switch in the available space
-        switch_center_x = rect.center().x()
-        switch_center_y = rect.top() + switch_radius + 5  # 5px top margin
-        switch_center = QPoint(switch_center_x, switch_center_y)
+        switch_center = QPoint(rect.center().x(), rect.top() + switch_radius + 5)  # 5px top margin
 
-        ring_thickness = 8
+        # Brightness ring
+        self._ring_rect = QRect(switch_center.x() - switch_radius, switch_center.y() - switch_radius,
+                                switch_size, switch_size)
+
+        # Inner circle (button background)
+        inner_radius = switch_radius - self.RING_THICKNESS - 5
+        self._inner_rect = QRect(switch_center.x() - inner_radius, switch_center.y() - inner_radius,
+                                 inner_radius * 2, inner_radius * 2)
+
+        # Power symbol (circle with gap and line), centered on the switch
+        icon_radius = inner_radius // 2
+        self._arc_rect = QRect(switch_center.x() - icon_radius, switch_center.y() - icon_radius,
+                               icon_radius * 2, icon_radius * 2)
+        self._icon_top = QPoint(switch_center.x(), switch_center.y() - icon_radius)
+        self._icon_bottom = QPoint(switch_center.x(), switch_center.y() - icon_radius // 3)
+
+        # Sync status dot (top right corner) and label (bottom)
+        self._sync_rect = QRect(rect.right() - 13, rect.top() + 7, 6, 6)
+        self._sync_dirty_rect = self._sync_rect.adjusted(-1, -1, 1, 1)  # Antialiased edge
+        self._label_rect = QRect(rect.left(), rect.bottom() - 25, rect.width(), 20)
+
+        # The button face only changes with the size and, for the icon, the state
+        self._face_rect = self._inner_rect.adjusted(-2, -2, 2, 2)  # Room for the border pen
+        self._face_pixmaps = {
+            'on': self._render_face(False, None),  # Icon drawn live in the switch color
+            'off': self._render_face(False, QColor(140, 140, 140)),  # Dark gray when off
+            'disabled': self._render_face(True, QColor(80, 80, 80)),  # Very dark gray when disabled
+        }
+
+        self._geom_dirty = False
+
+    def _render_face(self, is_disabled, icon_color):
+        """Render the inner circle and, if icon_color is given, the power icon into a pixmap"""
+        ratio = self.devicePixelRatioF()
+        pixmap = QPixmap(int(self._face_rect.width() * ratio), int(self._face_rect.height() * ratio))
+        pixmap.setDevicePixelRatio(ratio)
+        pixmap.fill(Qt.transparent)
+
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.translate(-self._face_rect.topLeft())
+
+        # Draw inner circle (button background)
+        # Darker gray when disabled
+        inner_color = QColor(60, 60, 60) if is_disabled else QColor(80, 80, 80)
+        border_color = QColor(80, 80, 80) if is_disabled else QColor(120, 120, 120)
+        painter.setPen(QPen(border_color, 2))
+        painter.setBrush(QBrush(inner_color))
+        painter.drawEllipse(self._inner_rect)
+
+        if icon_color is not None:
+            self._draw_power_icon(painter, icon_color)
+
+        painter.end()
+        return pixmap
+
+    def _draw_power_icon(self, painter, icon_color):
+        """Draw the power button icon (centered in inner circle)"""
+        painter.setPen(QPen(icon_color, 3))
+        painter.setBrush(Qt.NoBrush)
+
+        # Arc (circle with gap at top)
+        painter.drawArc(self._arc_rect, 135 * 16, 270 * 16)  # 135° to 45° (270° arc with gap at top)
+
+        # Vertical line at top
+        painter.drawLine(self._icon_top, self._icon_bottom)
+
+    def paintEvent(self, event):
+        if self._geom_dirty:
+            self._update_geometry()
+
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.Antialiasing)
 
         # If widget is disabled, draw with very muted colors
         is_disabled = not self.isEnabled()
 
-        # Draw brightness-based semicircular ring
-        ring_rect = QRect(switch_center.x() - switch_radius, switch_center.y() - switch_radius,
-                         switch_size, switch_size)
+        # A sync dot change repaints just the dot, see _update_sync_dot
+        dirty_rect = event.rect()
+        if not self._sync_dirty_rect.contains(dirty_rect):
+            self._paint_switch(painter, dirty_rect, is_disabled)
+
+        # Draw sync status indicator (small dot in corner)
+        if not self.is_synced and not is_disabled:
+            # Red dot for out-of-sync (only show when enabled)
+            painter.setPen(Qt.NoPen)
+            painter.setBrush(QBrush(QColor(255, 100, 100)))
+            painter.drawEllipse(self._sync_rect)
+
+    def _paint_switch(self, painter, dirty_rect, is_disabled):
+        """Draw the ring, button face and label, skipping parts outside dirty_rect"""
+        ring_thickness = self.RING_THICKNESS
 
-        if self.is_on and self.brightness > 0 and not is_disabled:
+        # Draw brightness-based semicircular ring
+        ring_rect = self._ring_rect
+        if not dirty_rect.intersects(ring_rect.adjusted(-ring_thickness, -ring_thickness,
+                                                        ring_thickness, ring_thickness)):
+            pass  # Ring is outside the repainted area
+        elif self.is_on and self.brightness > 0 and not is_disabled:
             # Calculate arc span based on brightness (0-100% -> 0-360°)
             # Start from top (90°) and go clockwise
             start_angle = 90 * 16  # 90° in Qt's 1/16th degree units (top position)
             arc_span = int((self.brightness / 100.0) * 360 * 16)  # Convert to 1/16th degrees
 
             # Use FULL BRIGHTNESS version of the color (vibrant and true)
-            vibrant_color = QColor.fromHsv(self.hue, int(self.saturation * 2.55), 255)  # Always max brightness (255)
-            ring_pen = QPen(vibrant_color, ring_thickness, Qt.SolidLine, Qt.RoundCap)
+            ring_pen = QPen(self._vibrant_color, ring_thickness, Qt.SolidLine, Qt.RoundCap)
             painter.setPen(ring_pen)
             painter.setBrush(Qt.NoBrush)
 
@@ -175,61 +311,23 @@ class CircularSwitch(QWidget):
             painter.setBrush(Qt.NoBrush)
             painter.drawEllipse(ring_rect)
 
-        # Draw inner circle (button background)
-        inner_radius = switch_radius - ring_thickness - 5
-        # Darker gray when disabled
-        inner_color = QColor(60, 60, 60) if is_disabled else QColor(80, 80, 80)
-        inner_brush = QBrush(inner_color)
-
-        border_color = QColor(80, 80, 80) if is_disabled else QColor(120, 120, 120)
-        painter.setPen(QPen(border_color, 2))
-        painter.setBrush(inner_brush)
-        inner_rect = QRect(switch_center.x() - inner_radius, switch_center.y() - inner_radius,
-                          inner_radius * 2, inner_radius * 2)
-        painter.drawEllipse(inner_rect)
-
-        # Draw power button icon (centered in inner circle)
-        if is_disabled:
-            # Very dark gray when disabled
-            icon_color = QColor(80, 80, 80)
-        elif self.is_on:
-            # Use FULL BRIGHTNESS version of the color (same as ring)
-            icon_color = QColor.fromHsv(self.hue, int(self.saturation * 2.55), 255)  # Always max brightness (255)
-        else:
-            # Dark gray when off
-            icon_color = QColor(140, 140, 140)
-
-        painter.setPen(QPen(icon_color, 3))
-        painter.setBrush(Qt.NoBrush)
-
-        # Power symbol (circle with gap and line) - centered
-        icon_radius = inner_radius // 2
-        icon_center = switch_center  # Use the same center as the switch
-
-        # Arc (circle with gap at top)
-        arc_rect = QRect(icon_center.x() - icon_radius, icon_center.y() - icon_radius,
-                        icon_radius * 2, icon_radius * 2)
-        painter.drawArc(arc_rect, 135 * 16, 270 * 16)  # 135° to 45° (270° arc with gap at top)
-
-        # Vertical line at top
-        painter.drawLine(icon_center.x(), icon_center.y() - icon_radius,
-                        icon_center.x(), icon_center.y() - icon_radius // 3)
-
-        # Draw sync status indicator (small dot in corner)
-        if not self.is_synced and not is_disabled:
-            # Red dot for out-of-sync (only show when enabled)
-            painter.setPen(Qt.NoPen)
-            painter.setBrush(QBrush(QColor(255, 100, 100)))
-            sync_x = rect.right() - 10
-            sync_y = rect.top() + 10
-            painter.drawEllipse(sync_x - 3, sync_y - 3, 6, 6)
+        # Draw button face (inner circle and power icon)
+        if dirty_rect.intersects(self._face_rect):
+            if is_disabled:
+                painter.drawPixmap(self._face_rect.topLeft(), self._face_pixmaps['disabled'])
+            elif self.is_on:
+                painter.drawPixmap(self._face_rect.topLeft(), self._face_pixmaps['on'])
+                # Use FULL BRIGHTNESS version of the color (same as ring)
+                self._draw_power_icon(painter, self._vibrant_color)
+            else:
+                painter.drawPixmap(self._face_rect.topLeft(), self._face_pixmaps['off'])
 
         # Draw label (centered at bottom) - dimmed when disabled
-        label_color = QColor(100, 100, 100) if is_disabled else QColor(220, 220, 220)
-        painter.setPen(QPen(label_color))
-        painter.setFont(QFont("Arial", 10))
-        label_rect = QRect(rect.left(), rect.bottom() - 25, rect.width(), 20)
-        painter.drawText(label_rect, Qt.AlignCenter, self.label)
+        if dirty_rect.intersects(self._label_rect):
+            label_color = QColor(100, 100, 100) if is_disabled else QColor(220, 220, 220)
+            painter.setPen(QPen(label_color))
+            painter.setFont(QFont("Arial", 10))
+            painter.drawText(self._label_rect, Qt.AlignCenter, self.label)
 
 
 class ColorWheelDialog(QDialog):
@@ -390,6 +488,8 @@ class ColorWheelDialog(QDialog):
         self.brightness_slider.setValue(self.brightness)
         self.brightness_slider.setFixedHeight(30)
         self.brightness_slider.valueChanged.connect(self._on_brightness_changed)
+        # Send the final brightness as soon as the slider is released
+        self.brightness_slider.sliderReleased.connect(self.dialog_color_rate_limiter.flush)
         self.brightness_slider.setToolTip("Precise brightness control (direct to device)")
 
         # Style the slider
@@ -933,18 +1033,7 @@ class ColorWheelDialog(QDialog):
 
     def _update_rgb_from_hsb(self, block_signals=False):
         """Update RGB sliders from current HSB values"""
-        # Convert HSB to RGB
-        # colorsys uses H=0-1, S=0-1, V=0-1
-        h_norm = self.hue / 360.0
-        s_norm = self.saturation / 100.0
-        v_norm = self.brightness / 100.0
-
-        r, g, b = colorsys.hsv_to_rgb(h_norm, s_norm, v_norm)
-
-        # Convert to 0-255 range
-        red = int(round(r * 255))
-        green = int(round(g * 255))
-        blue = int(round(b * 255))
+        red, green, blue = _hsb_to_rgb255(self.hue, self.saturation, self.brightness)
 
         # Update sliders
         if block_signals:
@@ -982,18 +1071,8 @@ class ColorWheelDialog(QDialog):
         self.green_value_label.setText(str(green))
         self.blue_value_label.setText(str(blue))
 
-        # Convert to normalized 0-1 range
-        r_norm = red / 255.0
-        g_norm = green / 255.0
-        b_norm = blue / 255.0
-
-        # Convert RGB to HSV
-        h_norm, s_norm, v_norm = colorsys.rgb_to_hsv(r_norm, g_norm, b_norm)
-
-        # Convert to our ranges (H=0-360, S=0-100, V=0-100)
-        hue = h_norm * 360
-        saturation = s_norm * 100
-        brightness = v_norm * 100
+        # Convert RGB to our ranges (H=0-360, S=0-100, V=0-100)
+        hue, saturation, brightness = _rgb255_to_hsb(red, green, blue)
 
         # Update internal state
         self.hue = hue
@@ -1400,7 +1479,9 @@ class VirtualSwitchesGUI(QMainWindow):
     def closeEvent(self, event):
         """Clean up when the application is closed"""
         if self.poco:
-            self.poco.disconnect()
+            self.poco.remove_state_callback(self._on_device_state_update)
+        # Flushes a pending settings save and disconnects the shared interface
+        self.can_widget.cleanup()
         event.accept()
 
 
@@ -1408,7 +1489,7 @@ def main():
     app = QApplication(sys.argv)
 
     # Setup logging - change level to control debug output
-    from poco_gui_common import setup_logging
+    from examples.poco_gui_common import setup_logging
     import logging
     setup_logging(logging.INFO)  # Change to logging.DEBUG to see details
 
@@ -0,0 +1,296 @@
+"""
+Poco CAN Example GUI Launcher - main window
+============================================
+
+Window class for example_launcher.py. Kept in its own module so the
+launcher entry point does not pay for the PyQt5 imports until main() runs.
+"""
+
+import sys
+import os
+from functools import lru_cache, partial
+from PyQt5.QtWidgets import QMainWindow
+from PyQt5.QtGui import QFont
+
+# Example applications: (button text, tooltip, script relative to the project directory)
+_APPS = (
+    ("Level 2: Virtual Switches (Actions)",
+     "Full-featured lighting control with colors, patterns, dimming (Proprietary VSw Actions)",
+     "examples/vsw_lev2_gui.py"),
+
+    ("Level 1: Virtual Switches as Binary On/Off",
+     "Control Poco Virtual Switches using NMEA2000 Binary Switch protocol (PGN 127501/127502)",
+     "examples/vsw_lev1_gui.py"),
+
+    ("Level 0: Output Channel Control (Hardware)",
+     "Direct hardware channel commands - PLI, PWM, Binary (PGN 61184 PIDs 6-8,16)",
+     "examples/channel_lev0_util.py"),
+)
+
+# Module names of the apps above, as run by examples.pyz and the warm spawner
+_APP_MODULES = tuple(os.path.splitext(os.path.basename(script))[0] for _, _, script in _APPS)
+
+# Set POCO_LAUNCHER_WARM_SPAWN=1 to start apps by forking a server process that
+# already has PyQt5 and the examples imported. Apps then share those pages
+# copy-on-write instead of importing them from scratch, but the launcher
+# process stays alive until every app it started has closed.
+WARM_SPAWN_ENV = 'POCO_LAUNCHER_WARM_SPAWN'
+
+
+def _warm_spawn_context():
+    """Return a forkserver context with the examples preloaded, or None when disabled"""
+    if os.environ.get(WARM_SPAWN_ENV) != '1':
+        return None
+
+    import multiprocessing
+    if 'forkserver' not in multiprocessing.get_all_start_methods():
+        return None
+
+    # The server is a fresh interpreter, not a fork of this Qt process, so
+    # it is safe to fork: it imports Qt but never creates a QApplication.
+    ctx = multiprocessing.get_context('forkserver')
+    ctx.set_forkserver_preload(['PyQt5.QtWidgets', 'examples.poco_gui_common'] +
+                               [f"examples.{name}" for name in _APP_MODULES])
+    return ctx
+
+
+def _run_example(app_name):
+    """Entry point of an app forked from the warm spawn server"""
+    import importlib
+
+    sys.argv = [app_name]
+    importlib.import_module(f"examples.{app_name}").main()
+
+
+def _warm_bytecode_cache(script_dir):
+    """Byte-compile the project and PyQt5 once per installation"""
+    import compileall
+    import PyQt5
+
+    pyqt_dir = os.path.dirname(PyQt5.__file__)
+    stamp_path = os.path.join(script_dir, "__pycache__", "launcher_warmup.stamp")
+    stamp = f"{sys.implementation.cache_tag}\n{pyqt_dir}\n"
+    try:
+        with open(stamp_path) as f:
+            if f.read().startswith(stamp):
+                return
+    except OSError:
+        pass
+
+    # workers=1: a process pool would fork this (Qt, multi-threaded) process.
+    # quiet=2: read-only site-packages are expected and not worth reporting;
+    # directories that cannot take a __pycache__ are skipped outright.
+    failed = [directory
+              for directory in (os.path.join(script_dir, "examples"),
+                                os.path.join(script_dir, "poco_can"),
+                                pyqt_dir)
+              if os.access(directory, os.W_OK)
+              and not compileall.compile_dir(directory, quiet=2, workers=1)]
+
+    # Stamp even after a failure (recorded for reference) so a source that
+    # never compiles does not restart the warm-up on every launch.
+    try:
+        os.makedirs(os.path.dirname(stamp_path), exist_ok=True)
+        with open(stamp_path, "w") as f:
+            f.write(stamp)
+            f.writelines(f"failed: {directory}\n" for directory in failed)
+    except OSError:
+        pass
+
+
+def start_bytecode_warmup():
+    """
+    Pre-generate __pycache__ for the examples and PyQt5 in the background,
+    so launched apps load cached bytecode instead of compiling sources.
+    """
+    import threading
+
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    threading.Thread(target=_warm_bytecode_cache, args=(script_dir,),
+                     name="bytecode-warmup", daemon=True).start()
+
+
+def _pyz_is_current(pyz, script_dir):
+    """Whether examples.pyz exists and is newer than every source it bundles"""
+    try:
+        pyz_mtime = os.stat(pyz).st_mtime
+        for package in ("examples", "poco_can"):
+            with os.scandir(os.path.join(script_dir, package)) as entries:
+                for entry in entries:
+                    if entry.name.endswith(".py") and entry.stat().st_mtime > pyz_mtime:
+                        return False
+    except OSError:
+        return False
+    return True
+
+
+@lru_cache(maxsize=None)
+def _font(family, size, weight=QFont.Normal):
+    """Return a shared QFont, avoiding repeated font database lookups."""
+    return QFont(family, size, weight)
+
+
+class LauncherGUI(QMainWindow):
+    """Simple launcher for Poco CAN applications."""
+
+    _STYLESHEET = """
+        QMainWindow {
+            background-color: #1a1a1a;
+        }
+        QWidget {
+            background-color: #1a1a1a;
+            color: #ffffff;
+        }
+        QPushButton {
+            background-color: #404040;
+            border: 1px solid #606060;
+            border-radius: 6px;
+            padding: 12px 20px;
+            color: #ffffff;
+            font-size: 15px;
+            text-align: center;
+        }
+        QPushButton:hover {
+            background-color: #505050;
+        }
+        QPushButton:pressed {
+            background-color: #353535;
+        }
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.setWindowTitle("Poco CAN GUI Launcher")
+        self.setGeometry(200, 200, 420, 380)
+
+        self.setStyleSheet(self._STYLESHEET)
+
+        # Child environment: PYTHONPATH includes the project directory so
+        # 'examples.poco_gui_common' imports work, followed by the import
+        # path this interpreter already resolved. Children are started with
+        # -S, so they skip site.py and .pth scanning but still see the same
+        # site-packages (venv, PyQt5, python-can) as the launcher.
+        self._script_dir = os.path.dirname(os.path.abspath(__file__))
+        child_path = [self._script_dir]
+        for path in sys.path:
+            if path and path not in child_path:
+                child_path.append(path)
+        env = os.environ.copy()
+        env['PYTHONPATH'] = os.pathsep.join(child_path)
+
+        # posix_spawn hands argv/env to the OS as bytes; encode them once here
+        # instead of on every launch. The subprocess fallback (Windows) needs
+        # the str environment, which Popen would reject as bytes.
+        self._child_env = env
+        self._child_env_bytes = {os.fsencode(k): os.fsencode(v) for k, v in env.items()}
+        self._executable = os.fsencode(sys.executable)
+        self._spawn_args = []
+
+        # PIDs of apps started with posix_spawn, reaped on the next launch
+        self._child_pids = []
+
+        # Optional fork-based warm spawn, see WARM_SPAWN_ENV. The server is
+        # started as soon as the event loop runs, so its imports happen while
+        # the user is still reading the window rather than on the first click.
+        self._warm_ctx = _warm_spawn_context()
+        if self._warm_ctx is not None:
+            from PyQt5.QtCore import QTimer
+            QTimer.singleShot(0, self._prewarm_spawn_server)
+
+        self._setup_ui()
+
+    def _setup_ui(self):
+        from PyQt5.QtCore import Qt
+        from PyQt5.QtWidgets import QWidget, QVBoxLayout, QLabel, QPushButton, QFrame
+
+        central_widget = QWidget()
+        self.setCentralWidget(central_widget)
+
+        layout = QVBoxLayout(central_widget)
+        layout.setSpacing(20)
+        layout.setContentsMargins(30, 30, 30, 30)
+
+        # Title, subtitle and info share one rich-text label
+        header = QLabel(
+            "<div style='font-size:20pt; font-weight:bold;'>Poco CAN Protocol Examples</div>"
+            "<div>Choose the protocol level for your application:</div>"
+            "<div style='font-size:9pt; color:#888888;'>"
+            "Each level provides progressively more capabilities.</div>")
+        header.setAlignment(Qt.AlignCenter)
+        header.setWordWrap(True)
+        header.setFont(_font("Arial", 11))
+        layout.addWidget(header)
+
+        # Separator
+        line = QFrame()
+        line.setFrameShape(QFrame.HLine)
+        line.setStyleSheet("background-color: #606060;")
+        layout.addWidget(line)
+
+        # Run the apps from examples.pyz (tools/build_examples_pyz.py) when it
+        # is up to date, otherwise from the example scripts directly, so that
+        # source edits are never shadowed by a stale archive
+        pyz = os.path.join(self._script_dir, "examples.pyz")
+        use_pyz = _pyz_is_current(pyz, self._script_dir)
+
+        # Example Application buttons - organized by protocol level
+        for index, (name, tooltip, script) in enumerate(_APPS):
+            btn = QPushButton(name)
+            btn.setMinimumHeight(50)
+            btn.setToolTip(tooltip)
+            if use_pyz:
+                argv = [self._executable, b"-S", os.fsencode(pyz), os.fsencode(_APP_MODULES[index])]
+            else:
+                argv = [self._executable, b"-S", os.fsencode(os.path.join(self._script_dir, script))]
+            self._spawn_args.append(argv)
+            btn.clicked.connect(partial(self._launch_app, index))
+            layout.addWidget(btn)
+
+        layout.addStretch()
+
+    def _launch_app(self, index, checked=False):
+        """Launch the selected application"""
+        argv = self._spawn_args[index]
+        try:
+            if self._warm_ctx is not None:
+                self._warm_ctx.Process(target=_run_example, args=(_APP_MODULES[index],),
+                                       name=_APP_MODULES[index]).start()
+            elif hasattr(os, 'posix_spawn'):
+                # posix_spawn avoids copying the launcher's (large, Qt-loaded)
+                # address space the way fork()+exec() does. It has no chdir
+                # file action, so the child inherits our cwd; imports are
+                # resolved through PYTHONPATH, not the working directory.
+                self._reap_children()
+                self._child_pids.append(os.posix_spawn(self._executable, argv, self._child_env_bytes))
+            else:
+                import subprocess
+                subprocess.Popen([os.fsdecode(arg) for arg in argv], cwd=self._script_dir,
+                                 env=self._child_env, start_new_session=True)
+        except OSError as e:
+            self._on_launch_error(_APPS[index][2], e)
+
+    def _prewarm_spawn_server(self):
+        """Start the warm spawn server ahead of the first launch"""
+        from multiprocessing import forkserver
+
+        try:
+            forkserver.ensure_running()
+        except OSError as e:
+            print(f"Warm spawn unavailable, using posix_spawn: {e}")
+            self._warm_ctx = None
+
+    def _on_launch_error(self, script, error):
+        """Report an application that could not be started"""
+        from PyQt5.QtWidgets import QMessageBox
+
+        print(f"Error launching {script}: {error}")
+        QMessageBox.critical(self, "Launch Failed", f"Could not launch {os.path.basename(script)}:\n{error}")
+
+    def _reap_children(self):
+        """Collect exit status of spawned apps that have already closed"""
+        for pid in list(self._child_pids):
+            try:
+                if os.waitpid(pid, os.WNOHANG)[0]:
+                    self._child_pids.remove(pid)
+            except ChildProcessError:
+                self._child_pids.remove(pid)
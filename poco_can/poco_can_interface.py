@@ -237,6 +237,15 @@ class PocoCANInterfaceBase:
         """
         return self.discovered_devices.copy()
 
+    def get_discovered_devices_sorted(self) -> list:
+        """
+        Get the discovered devices ordered by CAN address.
+
+        Returns:
+            List of (CAN address, device_info dict) tuples
+        """
+        return sorted(self.discovered_devices.items())
+
     def clear_discovered_devices(self):
         """Clear the list of discovered devices."""
         self.discovered_devices.clear()
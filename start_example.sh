@@ -18,6 +18,10 @@ PROJECT_DIR="$SCRIPT_DIR"
 # Load the virtual environment
 source "$PROJECT_DIR/sourceme.sh"
 
+# Bundle the examples into examples.pyz for faster app start-up (optional)
+python3 "$PROJECT_DIR/tools/build_examples_pyz.py" > /dev/null || \
+    echo -e "${YELLOW}Warning: examples.pyz not built, running example scripts directly${NC}"
+
 # Launch the Poco CAN Demo GUI
 echo -e "${BLUE}Starting Poco CAN Demo GUI...${NC}"
 python3 "$PROJECT_DIR/example_launcher.py"
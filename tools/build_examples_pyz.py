@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Build examples.pyz
+==================
+
+Bundles the poco_can and examples packages into a single zip application in
+the project directory. The example launcher runs apps from it when present:
+
+    python3 examples.pyz vsw_lev2_gui
+
+Serving every project module from one archive replaces the per-module
+directory scans and stat() calls of a normal import with a single zip index.
+Modules are stored with unchecked hash-based .pyc files next to their
+sources, so zipimport never has to recompile them. Rebuild whenever the
+sources change (start_example.sh does this on every start).
+
+Run with:
+    python3 tools/build_examples_pyz.py
+"""
+
+import os
+import py_compile
+import sys
+import tempfile
+import zipfile
+
+PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PACKAGES = ("poco_can", "examples")
+OUTPUT = os.path.join(PROJECT_DIR, "examples.pyz")
+
+MAIN_PY = '''\
+import importlib
+import sys
+
+if len(sys.argv) < 2:
+    sys.exit("usage: examples.pyz <example name>")
+
+# Run the example as if it were started directly: examples.<name>.main()
+module = importlib.import_module("examples." + sys.argv[1])
+sys.argv = [sys.argv[0]] + sys.argv[2:]
+module.main()
+'''
+
+
+def build(output=OUTPUT):
+    """Write the zip application and return its path"""
+    tmp_output = output + ".tmp"
+    with tempfile.TemporaryDirectory() as tmp_dir, \
+            zipfile.ZipFile(tmp_output, "w", zipfile.ZIP_STORED) as pyz:
+        pyz.writestr("__main__.py", MAIN_PY)
+
+        for package in PACKAGES:
+            package_dir = os.path.join(PROJECT_DIR, package)
+            for name in sorted(os.listdir(package_dir)):
+                if not name.endswith(".py"):
+                    continue
+                source = os.path.join(package_dir, name)
+                arcname = f"{package}/{name}"
+                pyz.write(source, arcname)
+
+                # zipimport looks for <module>.pyc beside <module>.py
+                cfile = os.path.join(tmp_dir, name + "c")
+                py_compile.compile(source, cfile=cfile, dfile=arcname, doraise=True,
+                                   invalidation_mode=py_compile.PycInvalidationMode.UNCHECKED_HASH)
+                pyz.write(cfile, arcname + "c")
+
+    os.replace(tmp_output, output)
+    return output
+
+
+def main():
+    try:
+        print(f"Built {build()}")
+    except (OSError, py_compile.PyCompileError) as e:
+        print(f"Error building examples.pyz: {e}", file=sys.stderr)
+        # Don't leave a stale archive behind for the launcher to pick up
+        for path in (OUTPUT, OUTPUT + ".tmp"):
+            if os.path.exists(path):
+                os.remove(path)
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()